@@ -2,70 +2,133 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
 
-from .const import CONF_SERIAL_PORT, DOMAIN, MANUFACTURER, MODEL, SW_VERSION
-from .hub import BromicHub
-from .services import async_remove_services, async_setup_services
+from .const import (
+    CONF_CONTROLLERS,
+    CONF_SERIAL_PORT,
+    DOMAIN,
+    MANUFACTURER,
+    MODEL,
+    SERVICE_LEARN_BUTTON,
+    SW_VERSION,
+    normalize_controllers,
+)
+from .exceptions import BromicError
+from .services import _ACTIVE_HUB_KEY, async_remove_services, async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+    from .hub import BromicHub
+
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.SWITCH,
     Platform.LIGHT,
-]
+)
+
+# Non-entry key in hass.data[DOMAIN] guarding concurrent service registration
+_SERVICES_LOCK_KEY = "_svc_lock"
+
+# Every non-entry key the integration parks in hass.data[DOMAIN]; the
+# last-entry check in async_unload_entry must ignore all of them
+_NON_ENTRY_KEYS = (_SERVICES_LOCK_KEY, _ACTIVE_HUB_KEY)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Bromic Smart Heat Link from a config entry."""
+    # Don't open the serial port for entries that are disabled but not yet
+    # reloaded; HA normally filters these, this is a cheap belt-and-braces
+    if entry.disabled_by is not None:
+        return False
+
     _LOGGER.debug("Setting up Bromic Smart Heat Link integration")
 
+    # Deferred imports: pyserial (via the hub) and the device registry are
+    # only needed once an entry actually sets up, not at manifest-scan time.
+    # sys.modules makes repeat setups free.
+    from homeassistant.helpers import device_registry as dr  # noqa: PLC0415
+
+    from .hub import BromicHub  # noqa: PLC0415
+
     # Get configuration (options override data for live port changes)
     port = entry.options.get(CONF_SERIAL_PORT, entry.data[CONF_SERIAL_PORT])
 
     # Initialize the hub
     hub = BromicHub(hass, port)
 
-    try:
-        # Connect to the device
-        await hub.async_connect()
-    except Exception as err:
-        _LOGGER.exception("Failed to connect to Bromic device")
-        raise ConfigEntryNotReady from err
+    # Normalize stored controller data (JSON string keys -> ints) once here;
+    # every platform setup reads this shared map instead of re-parsing options
+    hub.controllers = normalize_controllers(entry.options.get(CONF_CONTROLLERS, {}))
 
-    # Store hub in hass data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        "hub": hub,
-    }
+    # Store the hub before forwarding so platforms can resolve it while the
+    # serial connect is still in flight. runtime_data is the platform-facing
+    # handle; hass.data keeps the hub per entry for services and cleanup.
+    entry.runtime_data = hub
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[entry.entry_id] = hub
+
+    # Start the serial connect first; the registry work below overlaps it
+    connect_task = hass.async_create_task(hub.async_connect())
 
     # Ensure a parent "bridge" device exists for this serial port so that
-    # entity DeviceInfo.via_device references a valid device
-    port_id = hub.port.replace("/", "_").replace(":", "_")
+    # entity DeviceInfo.via_device references a valid device. This is a sync
+    # callback helper and doesn't depend on the connect outcome.
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, port_id)},
+        identifiers={(DOMAIN, hub.port_id)},
         name=f"Bromic Bridge ({hub.port})",
         manufacturer=MANUFACTURER,
         model=f"{MODEL} Bridge",
         sw_version=SW_VERSION,
     )
 
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Connect and forward platforms concurrently: the serial open dominates
+    # setup latency and the platform imports don't need a live connection.
+    # hass.async_create_task starts the forward eagerly (HA sets
+    # asyncio.eager_task_factory), so its sync portion runs without waiting
+    # for an event-loop turn.
+    forward_task = hass.async_create_task(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    )
+    try:
+        await connect_task
+    except (BromicError, OSError, TimeoutError) as err:
+        # Expected during retry backoff: debug-level, no traceback formatting
+        _LOGGER.debug("Failed to connect to Bromic device: %s", err)
+        # Let the in-flight forward settle (collecting its exception, if
+        # any) before unloading, so the unload never races half-set-up
+        # platforms and no task exception goes unretrieved
+        await asyncio.gather(forward_task, return_exceptions=True)
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        domain_data.pop(entry.entry_id, None)
+        raise ConfigEntryNotReady from err
+
+    try:
+        await forward_task
+    except Exception:
+        # Unlike the connect path, a forward failure of any type (import
+        # error, bad platform code, ...) must still unwind; re-raise as-is
+        # so HA records a real setup error instead of silently retrying
+        _LOGGER.exception("Platform setup failed")
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        # Connect succeeded above, so release the port before surfacing or
+        # each retry would open a fresh handle while this one is still held
+        await hub.async_disconnect()
+        domain_data.pop(entry.entry_id, None)
+        raise
 
-    # Register services
-    await _async_setup_services(hass)
+    # Register services off the critical path; they don't depend on entities
+    entry.async_create_task(hass, _async_setup_services(hass))
 
     _LOGGER.info("Bromic Smart Heat Link integration setup complete")
     return True
@@ -78,12 +141,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         # Disconnect from device
-        hub_data = hass.data[DOMAIN].pop(entry.entry_id)
-        hub: BromicHub = hub_data["hub"]
+        domain_data = hass.data[DOMAIN]
+        hub: BromicHub = domain_data.pop(entry.entry_id)
+        # Drop the cached service fast-path alias if it points at this hub,
+        # so a later service call can't be handed a disconnected hub
+        if domain_data.get(_ACTIVE_HUB_KEY) is hub:
+            del domain_data[_ACTIVE_HUB_KEY]
         await hub.async_disconnect()
 
         # Remove services if this was the last entry
-        if not hass.data[DOMAIN]:
+        if not [k for k in domain_data if k not in _NON_ENTRY_KEYS]:
+            for key in _NON_ENTRY_KEYS:
+                domain_data.pop(key, None)
             await _async_remove_services(hass)
 
     return unload_ok
@@ -91,15 +160,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    # Let config_entries chain the unload/setup: if unload fails the reload
+    # is aborted, so setup never races a still-held serial port.
+    hass.config_entries.async_schedule_reload(entry.entry_id)
 
 
 async def _async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for the integration."""
-    # Only set up services once (for the first entry)
-    if len(hass.data[DOMAIN]) == 1:
-        await async_setup_services(hass)
+    """Set up services for the integration (once, even with parallel entries)."""
+    # Cheap pre-lock check: subsequent entries skip the lock entirely
+    if hass.services.has_service(DOMAIN, SERVICE_LEARN_BUTTON):
+        return
+
+    lock = hass.data[DOMAIN].setdefault(_SERVICES_LOCK_KEY, asyncio.Lock())
+    async with lock:
+        if not hass.services.has_service(DOMAIN, SERVICE_LEARN_BUTTON):
+            await async_setup_services(hass)
 
 
 async def _async_remove_services(hass: HomeAssistant) -> None:
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
@@ -11,27 +15,36 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers import entity_registry as er
 
 from .const import (
     BUTTON_SEQUENCE_DIMMER,
     CONF_CONTROLLER_TYPE,
     CONF_CONTROLLERS,
     CONF_ID_LOCATION,
+    CONF_LEARN_FAST_MODE,
+    CONF_LEARN_RETRY_ATTEMPTS,
+    CONF_LEARN_RETRY_DELAY,
     CONF_LEARNED_BUTTONS,
+    CONF_LEARNED_COUNT,
     CONF_SERIAL_PORT,
     CONTROLLER_TYPE_DIMMER,
     CONTROLLER_TYPE_ONOFF,
+    DEFAULT_LEARN_RETRY_ATTEMPTS,
+    DEFAULT_LEARN_RETRY_DELAY,
     DIMMER_BUTTONS,
     DOMAIN,
+    LEARN_TIMEOUT,
     MAX_ID_LOCATION,
     MIN_ID_LOCATION,
     ONOFF_BUTTONS,
 )
-from .exceptions import BromicLearningError
-from .hub import BromicHub
+from .exceptions import BromicError, BromicLearningError
+from .hub import _PORT_ID_TABLE, BromicHub
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import HomeAssistant
     from homeassistant.data_entry_flow import FlowResult
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,12 +52,155 @@ _LOGGER = logging.getLogger(__name__)
 # Special option value to route user to manual serial port entry
 MANUAL_PORT_OPTION = "__manual__"
 
+# Short-lived cache for discovered serial ports: enumeration hits pyserial's
+# list_ports syscalls and the result rarely changes between form renders.
+# Kept in hass.data (not module scope) so each HA instance ages its own cache.
+_PORTS_CACHE_KEY = f"{DOMAIN}_ports_cache"
+_PORTS_TTL = 5.0
+
+
+def _build_port_options(ports: list[dict[str, str]]) -> dict[str, str]:
+    """Build the form's device -> label mapping for discovered ports."""
+    # Discovery pre-formats "label"; fall back for port dicts that lack it
+    return {
+        port["device"]: port.get("label") or f"{port['device']} - {port['description']}"
+        for port in ports
+    }
+
+
+async def _async_cached_discover_ports(
+    hass: HomeAssistant,
+) -> tuple[list[dict[str, str]], dict[str, str]]:
+    """
+    Discover serial ports, reusing a recent result if one exists.
+
+    Returns the raw port list and the prebuilt form options so repeated
+    renders across flows share one mapping instead of re-formatting labels.
+
+    Never raises: async_step_user runs this as a background task whose
+    exception would go unretrieved if the flow is abandoned before the
+    next render. Callers already treat an empty list as "offer manual
+    entry", so a failed enumeration degrades to that.
+    """
+    cached: tuple[float, list[dict[str, str]], dict[str, str]] | None = hass.data.get(
+        _PORTS_CACHE_KEY
+    )
+    if cached is not None and time.monotonic() - cached[0] < _PORTS_TTL:
+        return cached[1], cached[2]
+
+    try:
+        ports = await BromicHub.discover_ports(hass)
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Port discovery failed; offering manual entry", exc_info=True)
+        return [], {}
+    port_options = _build_port_options(ports)
+    hass.data[_PORTS_CACHE_KEY] = (time.monotonic(), ports, port_options)
+    return ports, port_options
+
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_SERIAL_PORT): str,
     }
 )
 
+# Static schemas/choices hoisted to module scope; rebuilding them on every
+# form render re-allocates the validator wrappers for no benefit
+_CONTROLLER_TYPE_CHOICES = {
+    CONTROLLER_TYPE_ONOFF: "ON/OFF Controller (4 buttons)",
+    CONTROLLER_TYPE_DIMMER: "Dimmer Controller (7 buttons)",
+}
+
+_INIT_MENU_OPTIONS = [
+    "change_serial_port",
+    "add_controller",
+    "adopt_controller",
+    "manage_controllers",
+    "advanced_settings",
+]
+
+_MANAGE_ACTIONS = {
+    "delete": "Delete Controller",
+}
+
+_LEARN_BUTTONS_ACTION_SCHEMA = vol.Schema(
+    {
+        vol.Required("action", default="learn_now"): vol.In(
+            {
+                "learn_now": "Send Learn Command",
+                "confirm_heard": "I heard the confirmation tones",
+                "retry": "I didn't hear it - retry",
+                "skip": "Skip this button",
+            }
+        )
+    }
+)
+
+
+def _advanced_settings_schema(options: Mapping[str, Any]) -> vol.Schema:
+    """Compile the advanced-settings form with current options as defaults."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_LEARN_RETRY_ATTEMPTS,
+                default=options.get(
+                    CONF_LEARN_RETRY_ATTEMPTS, DEFAULT_LEARN_RETRY_ATTEMPTS
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+            vol.Required(
+                CONF_LEARN_RETRY_DELAY,
+                default=options.get(CONF_LEARN_RETRY_DELAY, DEFAULT_LEARN_RETRY_DELAY),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=2.0)),
+            vol.Required(
+                CONF_LEARN_FAST_MODE,
+                default=options.get(CONF_LEARN_FAST_MODE, False),
+            ): bool,
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _controller_schema(available_ids: tuple[int, ...]) -> vol.Schema:
+    """Compile the add/adopt schema for a given set of selectable IDs."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_ID_LOCATION): vol.In(
+                {id_val: f"ID {id_val}" for id_val in available_ids}
+            ),
+            vol.Required(CONF_CONTROLLER_TYPE): vol.In(_CONTROLLER_TYPE_CHOICES),
+        }
+    )
+
+
+@lru_cache(maxsize=4)
+def _port_select_schema(port_items: tuple[tuple[str, str], ...]) -> vol.Schema:
+    """Compile the port-picker schema for a given option mapping."""
+    return vol.Schema({vol.Required(CONF_SERIAL_PORT): vol.In(dict(port_items))})
+
+
+@dataclass(slots=True)
+class _LearningState:
+    """
+    Mutable wizard state for one learn-buttons run.
+
+    Grouped in a slotted dataclass so the flow handler carries one
+    attribute instead of seven dict-backed ones per open flow.
+    """
+
+    learning_id: int | None = None
+    learning_type: str | None = None
+    learning_buttons: dict[int, bool] = field(default_factory=dict)
+    button_sequence: list[int] = field(default_factory=list)
+    button_infos: list[dict[str, Any]] = field(default_factory=list)
+    button_index: int = 0
+    button_total: int = 0
+    learned_count: int = 0
+    # Placeholder strings rendered on every wizard form; stringified once
+    # at learning start instead of per render
+    id_label: str = ""
+    total_label: str = ""
+    type_label: str = ""
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Bromic Smart Heat Link."""
@@ -55,6 +211,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._hub: BromicHub | None = None
         self._discovered_ports: list[dict[str, str]] = []
+        self._port_options: dict[str, str] = {}
+        self._ports_task: (
+            asyncio.Task[tuple[list[dict[str, str]], dict[str, str]]] | None
+        ) = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -80,23 +240,30 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     options={CONF_CONTROLLERS: {}},
                 )
 
-        # Discover available ports
+        # Discover ports in the background: enumeration costs tens of ms
+        # (sysfs walk / WMI), so the first form renders without waiting and
+        # any later render in this flow picks up whatever the task found
         if not self._discovered_ports:
-            self._discovered_ports = await BromicHub.discover_ports()
+            if self._ports_task is None:
+                self._ports_task = self.hass.async_create_task(
+                    _async_cached_discover_ports(self.hass)
+                )
+            if self._ports_task.done():
+                try:
+                    self._discovered_ports, self._port_options = (
+                        self._ports_task.result()
+                    )
+                except Exception:  # noqa: BLE001
+                    _LOGGER.debug("Port discovery failed; offering manual entry")
 
         # Create schema with discovered ports
         if self._discovered_ports:
+            # Allow manual entry in case the desired port is not listed
             port_options = {
-                port["device"]: f"{port['device']} - {port['description']}"
-                for port in self._discovered_ports
+                **self._port_options,
+                MANUAL_PORT_OPTION: "Other (enter manually)",
             }
-            # Allow manual entry in case the desired port is not listed
-            port_options[MANUAL_PORT_OPTION] = "Other (enter manually)"
-            schema = vol.Schema(
-                {
-                    vol.Required(CONF_SERIAL_PORT): vol.In(port_options),
-                }
-            )
+            schema = _port_select_schema(tuple(port_options.items()))
         else:
             schema = STEP_USER_DATA_SCHEMA
 
@@ -136,10 +303,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_connection(self, port: str) -> None:
         """Test connection to the device."""
+        # Raw-open probe first: fails in ~1ms for a missing/busy device node
+        # instead of paying for a full serial init and its timeouts
+        if not await BromicHub.async_validate_port(self.hass, port):
+            message = f"Cannot open {port}"
+            raise CannotConnectError(message)
+
         hub = BromicHub(self.hass, port)
         try:
-            await hub.async_connect()
-            await hub.async_test_connection()
+            # Bound the combined connect+probe round-trips so a wedged port
+            # can't hold the form longer than the learn timeout
+            await asyncio.wait_for(hub.async_connect(verify=True), LEARN_TIMEOUT)
         except Exception as err:
             _LOGGER.exception("Connection test failed")
             raise CannotConnectError from err
@@ -162,83 +336,126 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
         """Initialize options flow."""
         super().__init__(config_entry)
         self._hub: BromicHub | None = None
-        self._learning_id: int | None = None
-        self._learning_type: str | None = None
-        self._learning_buttons: dict[int, bool] = {}
-        self._button_sequence: list[int] = []
-        self._button_index: int = 0
+        self._state = _LearningState()
+        # Lazily derived registry-safe port id; reset when the port changes
+        self._port_id: str | None = None
+        # Ports discovered for this flow; re-renders after a failed
+        # validation reuse them instead of re-enumerating
+        self._discovered_ports: list[dict[str, str]] | None = None
+        self._discovered_options: dict[str, str] = {}
+        # int view of the str-keyed controllers map (options must stay
+        # JSON-serializable); invalidated by identity when options are saved
+        self._used_ids: set[int] | None = None
+        self._used_ids_src: dict[str, Any] | None = None
+        self._available_ids: list[int] | None = None
+
+    @property
+    def _current_port_id(self) -> str:
+        """Return the registry-safe id for the entry's serial port (cached)."""
+        if self._port_id is None:
+            port = self.config_entry.options.get(
+                CONF_SERIAL_PORT, self.config_entry.data[CONF_SERIAL_PORT]
+            )
+            self._port_id = port.translate(_PORT_ID_TABLE)
+        return self._port_id
+
+    def _schedule_entry_reload(self) -> None:
+        """
+        Queue an entry reload without delaying the flow's response.
+
+        A background task is not awaited by flow teardown and, started
+        non-eagerly, lets the save response serialize to the client before
+        the reload's unload phase takes the event loop.
+        """
+        self.hass.async_create_background_task(
+            self.hass.config_entries.async_reload(self.config_entry.entry_id),
+            name=f"{DOMAIN}_reload",
+            eager_start=False,
+        )
+
+    def _get_used_ids(self) -> set[int]:
+        """Return the in-use ID locations as ints, cached per options dict."""
+        controllers = self.config_entry.options.get(CONF_CONTROLLERS, {})
+        if self._used_ids is None or self._used_ids_src is not controllers:
+            self._used_ids = {int(id_str) for id_str in controllers}
+            self._used_ids_src = controllers
+            self._available_ids = None
+        return self._used_ids
+
+    def _get_available_ids(self) -> list[int]:
+        """Return up to 10 free ID locations, cached alongside the used set."""
+        used_ids = self._get_used_ids()
+        if self._available_ids is None:
+            # islice stops the scan at the 10 IDs the form can show
+            self._available_ids = list(
+                islice(
+                    (
+                        i
+                        for i in range(MIN_ID_LOCATION, MAX_ID_LOCATION + 1)
+                        if i not in used_ids
+                    ),
+                    10,
+                )
+            )
+        return self._available_ids
 
     async def async_step_init(
         self, _user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
-        return self.async_show_menu(
-            step_id="init",
-            menu_options=[
-                "change_serial_port",
-                "add_controller",
-                "adopt_controller",
-                "manage_controllers",
-            ],
-        )
+        return self.async_show_menu(step_id="init", menu_options=_INIT_MENU_OPTIONS)
 
     async def async_step_add_controller(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Add a new controller."""
         errors: dict[str, str] = {}
+        used_ids = self._get_used_ids()
 
         if user_input is not None:
             id_location = user_input[CONF_ID_LOCATION]
             controller_type = user_input[CONF_CONTROLLER_TYPE]
 
-            # Check if ID is already used
-            controllers = self.config_entry.options.get(CONF_CONTROLLERS, {})
-            if str(id_location) in controllers:
+            # Check if ID is already used (O(1) int-set membership)
+            if id_location in used_ids:
                 errors["base"] = "id_already_used"
             else:
                 # Start learning process
-                self._learning_id = id_location
-                self._learning_type = controller_type
-                self._learning_buttons = {}
+                self._state.learning_id = id_location
+                self._state.learning_type = controller_type
+                self._state.learning_buttons = {}
+                self._state.learned_count = 0
                 # Define learning order per controller type
                 if controller_type == CONTROLLER_TYPE_DIMMER:
-                    self._button_sequence = BUTTON_SEQUENCE_DIMMER.copy()
+                    self._state.button_sequence = BUTTON_SEQUENCE_DIMMER.copy()
+                    buttons = DIMMER_BUTTONS
                 else:
                     # Basic ON/OFF fallback sequence if ever used
-                    self._button_sequence = [1, 2]
-                self._button_index = 0
+                    self._state.button_sequence = [1, 2]
+                    buttons = ONOFF_BUTTONS
+                # Precompute button metadata aligned with the sequence so the
+                # render path indexes a list instead of nested dict lookups
+                self._state.button_infos = [
+                    buttons[b] for b in self._state.button_sequence
+                ]
+                self._state.button_index = 0
+                self._state.button_total = len(self._state.button_sequence)
+                self._state.id_label = str(id_location)
+                self._state.total_label = str(self._state.button_total)
+                self._state.type_label = (
+                    "Dimmer" if controller_type == CONTROLLER_TYPE_DIMMER else "ON/OFF"
+                )
 
                 return await self.async_step_learn_buttons()
 
-        # Get used IDs
-        controllers = self.config_entry.options.get(CONF_CONTROLLERS, {})
-        used_ids = [int(id_str) for id_str in controllers]
-        available_ids = [
-            i for i in range(MIN_ID_LOCATION, MAX_ID_LOCATION + 1) if i not in used_ids
-        ]
+        available_ids = self._get_available_ids()
 
         if not available_ids:
             return self.async_show_form(
                 step_id="add_controller", errors={"base": "no_available_ids"}
             )
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_ID_LOCATION): vol.In(
-                    {
-                        id_val: f"ID {id_val}"
-                        for id_val in available_ids[:10]  # Show first 10
-                    }
-                ),
-                vol.Required(CONF_CONTROLLER_TYPE): vol.In(
-                    {
-                        CONTROLLER_TYPE_ONOFF: "ON/OFF Controller (4 buttons)",
-                        CONTROLLER_TYPE_DIMMER: "Dimmer Controller (7 buttons)",
-                    }
-                ),
-            }
-        )
+        schema = _controller_schema(tuple(available_ids))
 
         return self.async_show_form(
             step_id="add_controller",
@@ -250,19 +467,15 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Learn button commands."""
-        if not self._learning_id or not self._learning_type:
-            return await self.async_step_init()
-
-        # Get button definitions
-        buttons = (
-            DIMMER_BUTTONS
-            if self._learning_type == CONTROLLER_TYPE_DIMMER
-            else ONOFF_BUTTONS
-        )
+        if not self._state.learning_id or not self._state.learning_type:
+            # Render the menu directly; re-entering async_step_init adds an
+            # await hop and a recursive frame for the same result
+            return self.async_show_menu(step_id="init", menu_options=_INIT_MENU_OPTIONS)
 
         # Determine the current button code from the sequence
         try:
-            current_button = self._button_sequence[self._button_index]
+            current_button = self._state.button_sequence[self._state.button_index]
+            button_info = self._state.button_infos[self._state.button_index]
         except IndexError:
             return await self._finish_learning()
 
@@ -272,7 +485,7 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                 # Send the learn command but do not advance; user will confirm
                 try:
                     await self._send_learn_with_retries(
-                        self._learning_id, current_button
+                        self._state.learning_id, current_button
                     )
                 except BromicLearningError as err:
                     return self.async_show_form(
@@ -280,58 +493,39 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                         errors={"base": "learning_failed"},
                         description_placeholders={
                             "error": str(err),
-                            "button_name": buttons[current_button]["name"],
+                            "button_name": button_info["name"],
                             "button_number": str(current_button),
-                            "id_location": str(self._learning_id),
+                            "id_location": self._state.id_label,
                         },
                     )
                 # Stay on same step
 
             if action == "confirm_heard":
-                self._learning_buttons[current_button] = True
-                self._button_index += 1
-                if self._button_index >= len(self._button_sequence):
+                self._state.learning_buttons[current_button] = True
+                self._state.learned_count += 1
+                self._state.button_index += 1
+                if self._state.button_index >= self._state.button_total:
                     return await self._finish_learning()
                 return await self.async_step_learn_buttons()
 
             if action == "skip":
-                self._learning_buttons[current_button] = False
-                self._button_index += 1
-                if self._button_index >= len(self._button_sequence):
+                self._state.learning_buttons[current_button] = False
+                self._state.button_index += 1
+                if self._state.button_index >= self._state.button_total:
                     return await self._finish_learning()
                 return await self.async_step_learn_buttons()
 
         # Show current button learning form
-        button_info = buttons[current_button]
-        learned_count = sum(self._learning_buttons.values())
-
-        schema = vol.Schema(
-            {
-                vol.Required("action", default="learn_now"): vol.In(
-                    {
-                        "learn_now": "Send Learn Command",
-                        "confirm_heard": "I heard the confirmation tones",
-                        "retry": "I didn't hear it - retry",
-                        "skip": "Skip this button",
-                    }
-                )
-            }
-        )
-
         return self.async_show_form(
             step_id="learn_buttons",
-            data_schema=schema,
+            data_schema=_LEARN_BUTTONS_ACTION_SCHEMA,
             description_placeholders={
                 "button_name": button_info["name"],
                 "button_number": str(current_button),
-                "id_location": str(self._learning_id),
-                "learned_count": str(learned_count),
-                "total_buttons": str(len(self._button_sequence)),
-                "controller_type": (
-                    "Dimmer"
-                    if self._learning_type == CONTROLLER_TYPE_DIMMER
-                    else "ON/OFF"
-                ),
+                "id_location": self._state.id_label,
+                "learned_count": str(self._state.learned_count),
+                "total_buttons": self._state.total_label,
+                "controller_type": self._state.type_label,
             },
         )
 
@@ -340,13 +534,15 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
     ) -> FlowResult:
         """Adopt an already programmed controller without running learning."""
         errors: dict[str, str] = {}
+        options = self.config_entry.options
+        controllers = options.get(CONF_CONTROLLERS, {})
+        used_ids = self._get_used_ids()
 
         if user_input is not None:
             id_location = user_input[CONF_ID_LOCATION]
             controller_type = user_input[CONF_CONTROLLER_TYPE]
 
-            controllers = self.config_entry.options.get(CONF_CONTROLLERS, {})
-            if str(id_location) in controllers:
+            if id_location in used_ids:
                 errors["base"] = "id_already_used"
             else:
                 # Assume all buttons for the selected controller type are available
@@ -357,47 +553,31 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                 else:
                     learned_buttons = dict.fromkeys(ONOFF_BUTTONS.keys(), True)
 
-                new_controllers = controllers.copy()
-                new_controllers[str(id_location)] = {
-                    CONF_CONTROLLER_TYPE: controller_type,
-                    CONF_LEARNED_BUTTONS: learned_buttons,
+                new_options = {
+                    **options,
+                    CONF_CONTROLLERS: {
+                        **controllers,
+                        str(id_location): {
+                            CONF_CONTROLLER_TYPE: controller_type,
+                            CONF_LEARNED_BUTTONS: learned_buttons,
+                            CONF_LEARNED_COUNT: sum(learned_buttons.values()),
+                        },
+                    },
                 }
 
-                new_options = self.config_entry.options.copy()
-                new_options[CONF_CONTROLLERS] = new_controllers
-
                 # Reload to create entities immediately
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self.config_entry.entry_id)
-                )
+                self._schedule_entry_reload()
 
                 return self.async_create_entry(title="", data=new_options)
 
-        # Get used and available IDs
-        controllers = self.config_entry.options.get(CONF_CONTROLLERS, {})
-        used_ids = [int(id_str) for id_str in controllers]
-        available_ids = [
-            i for i in range(MIN_ID_LOCATION, MAX_ID_LOCATION + 1) if i not in used_ids
-        ]
+        available_ids = self._get_available_ids()
 
         if not available_ids:
             return self.async_show_form(
                 step_id="adopt_controller", errors={"base": "no_available_ids"}
             )
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_ID_LOCATION): vol.In(
-                    {id_val: f"ID {id_val}" for id_val in available_ids[:10]}
-                ),
-                vol.Required(CONF_CONTROLLER_TYPE): vol.In(
-                    {
-                        CONTROLLER_TYPE_ONOFF: "ON/OFF Controller (4 buttons)",
-                        CONTROLLER_TYPE_DIMMER: "Dimmer Controller (7 buttons)",
-                    }
-                ),
-            }
-        )
+        schema = _controller_schema(tuple(available_ids))
 
         return self.async_show_form(
             step_id="adopt_controller",
@@ -408,13 +588,13 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
     async def _learn_button(self, id_location: int, button: int) -> None:
         """Learn a specific button."""
         # Get hub from integration data
-        hub_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
-        if not hub_data:
+        hub: BromicHub | None = self.hass.data.get(DOMAIN, {}).get(
+            self.config_entry.entry_id
+        )
+        if hub is None:
             message = "Integration not initialized"
             raise BromicLearningError(message)
 
-        hub: BromicHub = hub_data["hub"]
-
         if not hub.connected:
             message = "Device not connected"
             raise BromicLearningError(message)
@@ -422,10 +602,9 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
         try:
             # Send learning command
             response = await hub.async_send_command(id_location, button)
-        except Exception as err:
-            _LOGGER.exception(
-                "Learning failed for ID %d, Button %d", id_location, button
-            )
+        except (BromicError, OSError, TimeoutError) as err:
+            # Concrete failure set async_send_command can raise; the wizard
+            # surfaces the message on the form, so no log here
             message = f"Learning failed: {err}"
             raise BromicLearningError(message) from err
         if not response.success:
@@ -433,7 +612,11 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
             raise BromicLearningError(message)
 
     async def _send_learn_with_retries(
-        self, id_location: int, button: int, attempts: int = 3, delay: float = 0.8
+        self,
+        id_location: int,
+        button: int,
+        attempts: int | None = None,
+        delay: float | None = None,
     ) -> None:
         """
         Send the learn command a few times to align with the P3 window.
@@ -441,32 +624,50 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
         Some controllers only store the code if the command arrives slightly
         after P3 starts. We resend a couple times, spaced by a short delay,
         to improve reliability. Each send must succeed (ACK) or we abort.
+        Attempt count and spacing come from entry options when set, so slow
+        controllers can be tuned without a code change. Fast-learn mode stops
+        after the first acknowledged send instead of always resending.
         """
+        options = self.config_entry.options
+        if attempts is None:
+            attempts = options.get(
+                CONF_LEARN_RETRY_ATTEMPTS, DEFAULT_LEARN_RETRY_ATTEMPTS
+            )
+        if delay is None:
+            delay = options.get(CONF_LEARN_RETRY_DELAY, DEFAULT_LEARN_RETRY_DELAY)
+        fast_mode = options.get(CONF_LEARN_FAST_MODE, False)
+
         for attempt in range(1, max(1, attempts) + 1):
             await self._learn_button(id_location, button)
+            if fast_mode:
+                # Opt-in: the first ACKed send is trusted to have landed in
+                # the learn window; skips the remaining resends and sleeps
+                break
             if attempt < attempts:
-                await self.hass.async_add_executor_job(lambda: None)  # no-op yield
+                # The sleep already yields to the loop; no executor hop needed
                 await asyncio.sleep(delay)
 
     async def _finish_learning(self) -> FlowResult:
         """Finish the learning process and save configuration."""
-        if not self._learning_id or not self._learning_type:
-            return await self.async_step_init()
-
-        # Update options
-        controllers = self.config_entry.options.get(CONF_CONTROLLERS, {}).copy()
-        controllers[str(self._learning_id)] = {
-            CONF_CONTROLLER_TYPE: self._learning_type,
-            CONF_LEARNED_BUTTONS: self._learning_buttons,
+        if not self._state.learning_id or not self._state.learning_type:
+            return self.async_show_menu(step_id="init", menu_options=_INIT_MENU_OPTIONS)
+
+        # Update options in a single merge expression (one allocation per level)
+        options = self.config_entry.options
+        new_options = {
+            **options,
+            CONF_CONTROLLERS: {
+                **options.get(CONF_CONTROLLERS, {}),
+                str(self._state.learning_id): {
+                    CONF_CONTROLLER_TYPE: self._state.learning_type,
+                    CONF_LEARNED_BUTTONS: self._state.learning_buttons,
+                    CONF_LEARNED_COUNT: sum(self._state.learning_buttons.values()),
+                },
+            },
         }
 
-        new_options = self.config_entry.options.copy()
-        new_options[CONF_CONTROLLERS] = controllers
-
         # Reload the integration to create new entities
-        self.hass.async_create_task(
-            self.hass.config_entries.async_reload(self.config_entry.entry_id)
-        )
+        self._schedule_entry_reload()
 
         return self.async_create_entry(
             title="",
@@ -477,7 +678,8 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage existing controllers."""
-        controllers = self.config_entry.options.get(CONF_CONTROLLERS, {})
+        options = self.config_entry.options
+        controllers = options.get(CONF_CONTROLLERS, {})
 
         if not controllers:
             return self.async_show_form(
@@ -489,37 +691,25 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
             action = user_input["action"]
 
             if action == "delete":
-                # Remove controller
-                new_controllers = controllers.copy()
-                del new_controllers[controller_id]
-
-                new_options = self.config_entry.options.copy()
-                new_options[CONF_CONTROLLERS] = new_controllers
+                # Remove controller (single-merge rebuild of the options dict)
+                new_controllers = {
+                    k: v for k, v in controllers.items() if k != controller_id
+                }
+                new_options = {
+                    **options,
+                    CONF_CONTROLLERS: new_controllers,
+                }
 
-                # Purge device and its entities from registries
+                # Purge the device; the device registry cascades removal of
+                # the device's entities, collapsing N registry writes into one
                 dev_reg = dr.async_get(self.hass)
-                ent_reg = er.async_get(self.hass)
-                port_id = (
-                    self.config_entry.options.get(
-                        CONF_SERIAL_PORT, self.config_entry.data[CONF_SERIAL_PORT]
-                    )
-                    .replace("/", "_")
-                    .replace(":", "_")
-                )
-                device_identifier = (DOMAIN, f"{port_id}_{controller_id}")
+                device_identifier = (DOMAIN, f"{self._current_port_id}_{controller_id}")
                 device = dev_reg.async_get_device(identifiers={device_identifier})
                 if device:
-                    # Remove entities then device
-                    for ent_id in list(ent_reg.entities):
-                        entry = ent_reg.async_get(ent_id)
-                        if entry and entry.device_id == device.id:
-                            ent_reg.async_remove(ent_id)
                     dev_reg.async_remove_device(device.id)
 
                 # Reload integration to reflect removal
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self.config_entry.entry_id)
-                )
+                self._schedule_entry_reload()
 
                 return self.async_create_entry(title="", data=new_options)
 
@@ -530,8 +720,12 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
             type_name = (
                 "Dimmer" if controller_type == CONTROLLER_TYPE_DIMMER else "ON/OFF"
             )
-            learned_buttons = controller_info.get(CONF_LEARNED_BUTTONS, {})
-            learned_count = sum(learned_buttons.values())
+            # Prefer the count persisted at learn time; entries written
+            # before it existed fall back to summing the button map
+            learned_count = controller_info.get(CONF_LEARNED_COUNT)
+            if learned_count is None:
+                learned_buttons = controller_info.get(CONF_LEARNED_BUTTONS, {})
+                learned_count = sum(learned_buttons.values())
 
             controller_options[id_str] = (
                 f"ID {id_str} ({type_name}) - {learned_count} buttons"
@@ -540,11 +734,7 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
         schema = vol.Schema(
             {
                 vol.Required("controller_id"): vol.In(controller_options),
-                vol.Required("action"): vol.In(
-                    {
-                        "delete": "Delete Controller",
-                    }
-                ),
+                vol.Required("action"): vol.In(_MANAGE_ACTIONS),
             }
         )
 
@@ -553,7 +743,20 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
             data_schema=schema,
         )
 
-    # Advanced settings removed (no options currently)
+    async def async_step_advanced_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Tune the learn-command retry behavior for this entry."""
+        if user_input is not None:
+            # _send_learn_with_retries reads these from entry options on
+            # every learn, so no reload is needed for them to take effect
+            new_options = {**self.config_entry.options, **user_input}
+            return self.async_create_entry(title="", data=new_options)
+
+        return self.async_show_form(
+            step_id="advanced_settings",
+            data_schema=_advanced_settings_schema(self.config_entry.options),
+        )
 
     async def async_step_change_serial_port(
         self, user_input: dict[str, Any] | None = None
@@ -569,20 +772,29 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
             new_port = user_input[CONF_SERIAL_PORT]
             hub = BromicHub(self.hass, new_port)
             try:
-                await hub.async_connect()
-                await hub.async_test_connection()
+                # Raw-open probe fails fast before the full serial connect
+                if not await BromicHub.async_validate_port(self.hass, new_port):
+                    message = f"Cannot open {new_port}"
+                    raise CannotConnectError(message)  # noqa: TRY301
+                await hub.async_connect(verify=True)
             except Exception:  # noqa: BLE001
                 _LOGGER.debug("Port validation failed for %s", new_port)
                 errors["base"] = "cannot_connect"
             else:
-                await hub.async_disconnect()
+                # Close the validation hub in the background, overlapped with
+                # the options/registry bookkeeping below; awaited before the
+                # reload so the port is free when setup reopens it
+                disconnect_task = self.hass.async_create_task(hub.async_disconnect())
 
-                # Persist to options
-                new_options = self.config_entry.options.copy()
-                old_port = new_options.get(
+                # Persist to options with a single merge expression
+                old_port = self.config_entry.options.get(
                     CONF_SERIAL_PORT, self.config_entry.data[CONF_SERIAL_PORT]
                 )
-                new_options[CONF_SERIAL_PORT] = new_port
+                new_options = {
+                    **self.config_entry.options,
+                    CONF_SERIAL_PORT: new_port,
+                }
+                self._port_id = None  # derived id is stale for the new port
 
                 # Update the entry title so the UI reflects the new port
                 try:
@@ -608,25 +820,28 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                 except Exception:  # noqa: BLE001
                     _LOGGER.debug("Failed to remove old bridge device for %s", old_port)
 
+                await disconnect_task
+
                 # Reload integration to apply new port
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self.config_entry.entry_id)
-                )
+                self._schedule_entry_reload()
 
                 return self.async_create_entry(title="", data=new_options)
 
-        # Offer discovered ports if we have them
-        discovered = await BromicHub.discover_ports()
-        if discovered:
+        # Offer discovered ports if we have them; enumerate once per flow
+        if self._discovered_ports is None:
+            (
+                self._discovered_ports,
+                self._discovered_options,
+            ) = await _async_cached_discover_ports(self.hass)
+        if self._discovered_ports:
+            # Include manual option
             port_options = {
-                port["device"]: f"{port['device']} - {port['description']}"
-                for port in discovered
+                **self._discovered_options,
+                MANUAL_PORT_OPTION: "Other (enter manually)",
             }
-            # Include manual option
-            port_options[MANUAL_PORT_OPTION] = "Other (enter manually)"
-            schema = vol.Schema({vol.Required(CONF_SERIAL_PORT): vol.In(port_options)})
+            schema = _port_select_schema(tuple(port_options.items()))
         else:
-            schema = vol.Schema({vol.Required(CONF_SERIAL_PORT): str})
+            schema = STEP_USER_DATA_SCHEMA
 
         return self.async_show_form(
             step_id="change_serial_port",
@@ -644,19 +859,26 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
             new_port = user_input[CONF_SERIAL_PORT]
             hub = BromicHub(self.hass, new_port)
             try:
-                await hub.async_connect()
-                await hub.async_test_connection()
+                if not await BromicHub.async_validate_port(self.hass, new_port):
+                    message = f"Cannot open {new_port}"
+                    raise CannotConnectError(message)  # noqa: TRY301
+                await hub.async_connect(verify=True)
             except Exception:  # noqa: BLE001
                 _LOGGER.debug("Port validation failed for %s (manual)", new_port)
                 errors["base"] = "cannot_connect"
             else:
-                await hub.async_disconnect()
+                # Same overlap as async_step_change_serial_port: close in the
+                # background, await before the reload reopens the port
+                disconnect_task = self.hass.async_create_task(hub.async_disconnect())
 
-                new_options = self.config_entry.options.copy()
-                old_port = new_options.get(
+                old_port = self.config_entry.options.get(
                     CONF_SERIAL_PORT, self.config_entry.data[CONF_SERIAL_PORT]
                 )
-                new_options[CONF_SERIAL_PORT] = new_port
+                new_options = {
+                    **self.config_entry.options,
+                    CONF_SERIAL_PORT: new_port,
+                }
+                self._port_id = None  # derived id is stale for the new port
 
                 try:
                     self.hass.config_entries.async_update_entry(
@@ -678,9 +900,9 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                 except Exception:  # noqa: BLE001
                     _LOGGER.debug("Failed to remove old bridge device for %s", old_port)
 
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self.config_entry.entry_id)
-                )
+                await disconnect_task
+
+                self._schedule_entry_reload()
 
                 return self.async_create_entry(title="", data=new_options)
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from contextlib import suppress
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "bromic_smart_heat_link"
@@ -13,27 +14,35 @@ CONF_CONTROLLERS: Final = "controllers"
 CONF_CONTROLLER_TYPE: Final = "controller_type"
 CONF_ID_LOCATION: Final = "id_location"
 CONF_LEARNED_BUTTONS: Final = "learned_buttons"
+# Count of learned buttons, persisted at learn time so list renders don't
+# re-sum the button map; absent in pre-existing entries (readers fall back)
+CONF_LEARNED_COUNT: Final = "learned_count"
 
 # Controller types
 CONTROLLER_TYPE_ONOFF: Final = "onoff"
 CONTROLLER_TYPE_DIMMER: Final = "dimmer"
 
-# Serial configuration
-SERIAL_CONFIG: Final = {
-    "baudrate": 19200,
-    "bytesize": 8,
-    "parity": "N",
-    "stopbits": 1,
-    "timeout": 1.0,
-    "write_timeout": 1.0,
-    "xonxoff": False,
-    "rtscts": False,
-    "dsrdtr": False,
-}
+# Serial configuration (read-only views: these mappings are shared
+# process-wide and must never be mutated by a caller)
+SERIAL_CONFIG: Final = MappingProxyType(
+    {
+        "baudrate": 19200,
+        "bytesize": 8,
+        "parity": "N",
+        "stopbits": 1,
+        "timeout": 1.0,
+        "write_timeout": 1.0,
+        "xonxoff": False,
+        "rtscts": False,
+        "dsrdtr": False,
+    }
+)
 
 # Protocol constants
 COMMAND_BYTE: Final = 0x54  # 'T' in ASCII
 ACK_RESPONSE: Final = bytes([0x54, 0x06, 0x5A])
+# Same frame packed into one int so the decoder compares word-to-word
+ACK_RESPONSE_INT: Final = int.from_bytes(ACK_RESPONSE, "big")
 LEARN_TIMEOUT: Final = 5.0  # seconds
 COMMAND_TIMEOUT: Final = 1.5  # seconds
 MAX_RETRIES: Final = 3
@@ -50,46 +59,87 @@ MIN_STD_RESPONSE_LENGTH: Final = 3
 MIN_FRAME_LENGTH: Final = 6
 
 # Button mappings for different controller types (simplified - no channels)
-ONOFF_BUTTONS: Final = {
-    1: {"name": "ON", "function": "turn_on"},
-    2: {"name": "OFF", "function": "turn_off"},
-}
-
-DIMMER_BUTTONS: Final = {
-    1: {"name": "100%", "function": "set_brightness", "level": 100},
-    2: {"name": "75%", "function": "set_brightness", "level": 75},
-    3: {"name": "50%", "function": "set_brightness", "level": 50},
-    4: {"name": "25%", "function": "set_brightness", "level": 25},
-    8: {"name": "Off", "function": "turn_off"},
-}
+ONOFF_BUTTONS: Final = MappingProxyType(
+    {
+        1: {"name": "ON", "function": "turn_on"},
+        2: {"name": "OFF", "function": "turn_off"},
+    }
+)
+
+DIMMER_BUTTONS: Final = MappingProxyType(
+    {
+        1: {"name": "100%", "function": "set_brightness", "level": 100},
+        2: {"name": "75%", "function": "set_brightness", "level": 75},
+        3: {"name": "50%", "function": "set_brightness", "level": 50},
+        4: {"name": "25%", "function": "set_brightness", "level": 25},
+        8: {"name": "Off", "function": "turn_off"},
+    }
+)
+
+# Flat code->value views of the button tables: state-attribute reads index
+# these directly instead of doing a nested dict-in-dict lookup per call
+ONOFF_BUTTON_NAMES: Final = MappingProxyType(
+    {code: meta["name"] for code, meta in ONOFF_BUTTONS.items()}
+)
+DIMMER_BUTTON_NAMES: Final = MappingProxyType(
+    {code: meta["name"] for code, meta in DIMMER_BUTTONS.items()}
+)
+DIMMER_BUTTON_FUNCTIONS: Final = MappingProxyType(
+    {code: meta["function"] for code, meta in DIMMER_BUTTONS.items()}
+)
 
 # Brightness level mappings (HA 0-255 to Bromic levels); names map to translation keys
-BRIGHTNESS_LEVELS: Final = {
-    0: {"button": OFF_BUTTON_CODE, "name": "Off"},
-    64: {"button": 4, "name": "25"},
-    128: {"button": 3, "name": "50"},
-    191: {"button": 2, "name": "75"},
-    255: {"button": 1, "name": "100"},
-}
+BRIGHTNESS_LEVELS: Final = MappingProxyType(
+    {
+        0: {"button": OFF_BUTTON_CODE, "name": "Off"},
+        64: {"button": 4, "name": "25"},
+        128: {"button": 3, "name": "50"},
+        191: {"button": 2, "name": "75"},
+        255: {"button": 1, "name": "100"},
+    }
+)
 
 # Learning sequence for dimmer controllers (show Off last)
 BUTTON_SEQUENCE_DIMMER: Final = [1, 2, 3, 4, OFF_BUTTON_CODE]
 
+# Learn-command retry tuning (overridable via config entry options)
+CONF_LEARN_RETRY_ATTEMPTS: Final = "learn_retry_attempts"
+CONF_LEARN_RETRY_DELAY: Final = "learn_retry_delay"
+CONF_LEARN_FAST_MODE: Final = "learn_fast_mode"
+DEFAULT_LEARN_RETRY_ATTEMPTS: Final = 3
+DEFAULT_LEARN_RETRY_DELAY: Final = 0.3  # seconds between learn resends
+
 # Error codes from Bromic documentation
-ERROR_CODES: Final = {
-    0x00: "Framing error",
-    0x01: "Checksum error",
-    0x02: "Wrong command error",
-    0x03: "ID = 0 error",
-    0x04: "ID > 2000 error",
-    0x05: "Number of code to read/delete = 0 error",
-    0x06: "Number of code to read > 16 or >128 error",
-    0x07: "Number of code to read/delete > 2000 (out of range) error",
-    0x08: "Serial code already stored error",
-    0x09: "ID < 201 error",
-    0x10: "Empty location transmission attempt error",
-    0x11: "Value out of valid codes range memorization attempt error",
-}
+ERROR_CODES: Final = MappingProxyType(
+    {
+        0x00: "Framing error",
+        0x01: "Checksum error",
+        0x02: "Wrong command error",
+        0x03: "ID = 0 error",
+        0x04: "ID > 2000 error",
+        0x05: "Number of code to read/delete = 0 error",
+        0x06: "Number of code to read > 16 or >128 error",
+        0x07: "Number of code to read/delete > 2000 (out of range) error",
+        0x08: "Serial code already stored error",
+        0x09: "ID < 201 error",
+        0x10: "Empty location transmission attempt error",
+        0x11: "Value out of valid codes range memorization attempt error",
+    }
+)
+
+# Error-code keyspace is dense and tiny (<= 0x11), so message resolution
+# indexes a tuple instead of hashing into the dict per decode
+_ERROR_TABLE: Final = tuple(
+    ERROR_CODES.get(i, f"Unknown error code: {i:02X}") for i in range(0x12)
+)
+
+
+def error_message(code: int) -> str:
+    """Return the human-readable message for a device error code."""
+    if 0 <= code < len(_ERROR_TABLE):
+        return _ERROR_TABLE[code]
+    return f"Unknown error code: {code:02X}"
+
 
 # Error response format
 ERROR_COMMAND: Final = 0x45  # 'E' in ASCII
@@ -124,6 +174,22 @@ ATTR_ERROR_COUNT: Final = "error_count"
 def normalize_controller_data(controller_info: dict) -> dict:
     """Normalize controller data loaded from storage (convert keys to ints)."""
     learned = controller_info.get(CONF_LEARNED_BUTTONS, {})
-    with suppress(Exception):
-        learned = {int(k): v for k, v in learned.items()}
+    # Already int-keyed (in-memory edits) or empty: skip the rebuild and
+    # the suppress() context entirely
+    if learned and not isinstance(next(iter(learned)), int):
+        with suppress(Exception):
+            learned = {int(k): v for k, v in learned.items()}
     return {**controller_info, CONF_LEARNED_BUTTONS: learned}
+
+
+def normalize_controllers(controllers: dict) -> dict[int, dict]:
+    """
+    Normalize a whole stored controllers mapping (id and button keys to ints).
+
+    Done once at entry setup so each platform reads the shared typed dict
+    instead of re-normalizing per controller per platform.
+    """
+    return {
+        int(id_str): normalize_controller_data(controller_info)
+        for id_str, controller_info in controllers.items()
+    }
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.helpers import entity_registry as er
 
-from .const import CONF_SERIAL_PORT, DOMAIN
+from .const import CONF_SERIAL_PORT
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -22,11 +22,10 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    hub_data = hass.data[DOMAIN][entry.entry_id]
-    hub: BromicHub = hub_data["hub"]
+    hub: BromicHub = entry.runtime_data
 
-    # Get hub statistics
-    stats = hub.stats
+    # Get hub statistics (materialize the read-only view for serialization)
+    stats = dict(hub.stats)
 
     # Get controller information
     controllers = entry.options.get("controllers", {})
@@ -40,7 +39,8 @@ async def async_get_config_entry_diagnostics(
             "learned_buttons": learned_buttons,
         }
 
-    # Collect entity information
+    # Collect entity information via the registry's per-entry index rather
+    # than filtering every entity in the install
     entity_registry = er.async_get(hass)
     entities = [
         {
@@ -49,8 +49,9 @@ async def async_get_config_entry_diagnostics(
             "unique_id": entity_entry.unique_id,
             "disabled": entity_entry.disabled,
         }
-        for entity_entry in entity_registry.entities.values()
-        if entity_entry.config_entry_id == entry.entry_id
+        for entity_entry in er.async_entries_for_config_entry(
+            entity_registry, entry.entry_id
+        )
     ]
 
     return {
@@ -28,6 +28,20 @@ _LOGGER = logging.getLogger(__name__)
 class BromicEntity(Entity):
     """Base entity for Bromic Smart Heat Link devices."""
 
+    # Slot the hot per-entity attributes: with up to 50 ID locations the
+    # per-instance dict entries add up, and slot access skips the dict lookup.
+    # (Entity itself still provides __dict__ for the _attr_* machinery.)
+    __slots__ = (
+        "_attrs_cache",
+        "_command_count",
+        "_controller_type",
+        "_entity_type",
+        "_error_count",
+        "_hub",
+        "_id_location",
+        "_last_command_time",
+    )
+
     def __init__(
         self,
         hub: BromicHub,
@@ -50,15 +64,23 @@ class BromicEntity(Entity):
         self._controller_type = controller_type
         self._entity_type = entity_type
 
-        # Generate unique identifiers (no channel concept)
-        port_id = self._hub.port.replace("/", "_").replace(":", "_")
-        self._attr_unique_id = f"{DOMAIN}_{port_id}_{id_location}_{entity_type}"
+        # Generate unique identifiers (no channel concept).
+        # %-formatting: cheaper than f-string int coercion in per-entity
+        # constructors, which run once per learned controller at setup.
+        # The registry-safe port id is computed once on the hub, not per entity
+        port_id = self._hub.port_id
+        self._attr_unique_id = "%s_%s_%d_%s" % (  # noqa: UP031
+            DOMAIN,
+            port_id,
+            id_location,
+            entity_type,
+        )
 
         # Use device name + short entity name for IDs
         self._attr_has_entity_name = True
 
         # Device and default names
-        device_name = f"Bromic ID{id_location}"
+        device_name = "Bromic ID%d" % id_location  # noqa: UP031
         # When has_entity_name is True, leaving entity name as None makes the
         # primary entity's object_id derive solely from the device name.
         self._attr_name = None
@@ -78,24 +100,30 @@ class BromicEntity(Entity):
         self._last_command_time: float | None = None
         self._command_count = 0
         self._error_count = 0
+        # Cached attribute dict; rebuilt only after a command updates the stats
+        self._attrs_cache: dict[str, Any] | None = None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        attrs = {
-            ATTR_ID_LOCATION: self._id_location,
-        }
+        if self._attrs_cache is None:
+            attrs = {
+                ATTR_ID_LOCATION: self._id_location,
+            }
+
+            if self._last_command_time:
+                attrs[ATTR_LAST_COMMAND_TIME] = self._last_command_time
 
-        if self._last_command_time:
-            attrs[ATTR_LAST_COMMAND_TIME] = self._last_command_time
+            if self._command_count > 0:
+                attrs[ATTR_COMMAND_COUNT] = self._command_count
 
-        if self._command_count > 0:
-            attrs[ATTR_COMMAND_COUNT] = self._command_count
+            if self._error_count > 0:
+                attrs[ATTR_ERROR_COUNT] = self._error_count
 
-        if self._error_count > 0:
-            attrs[ATTR_ERROR_COUNT] = self._error_count
+            self._attrs_cache = attrs
 
-        return attrs
+        # Return a copy so platform subclasses can overlay their own keys
+        return dict(self._attrs_cache)
 
     async def async_send_command(self, button_code: int) -> bool:
         """
@@ -126,7 +154,7 @@ class BromicEntity(Entity):
             return False
         else:
             if response.success:
-                self._last_command_time = self._hub.stats["last_success"]
+                self._last_command_time = self._hub.last_success_ts
                 self._attr_available = True
                 _LOGGER.debug(
                     "Command successful: ID=%d, Button=%d, Entity=%s",
@@ -144,6 +172,12 @@ class BromicEntity(Entity):
                 response.message,
             )
             return False
+        finally:
+            # Invalidate only after the stats above are updated: a state
+            # read during the in-flight command would otherwise re-cache
+            # the old counts and nothing would refresh them until the
+            # next command
+            self._attrs_cache = None
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added to hass."""
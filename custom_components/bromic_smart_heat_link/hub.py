@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import threading
 import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 import serial
@@ -15,6 +17,7 @@ from .const import (
     COMMAND_TIMEOUT,
     INTER_FRAME_DELAY,
     MAX_RETRIES,
+    MIN_STD_RESPONSE_LENGTH,
     SERIAL_CONFIG,
 )
 from .exceptions import (
@@ -25,12 +28,15 @@ from .exceptions import (
 from .protocol import BromicCommand, BromicProtocol, BromicResponse
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+# Registry identifiers can't contain / or : — munge them to underscores
+_PORT_ID_TABLE = str.maketrans("/:", "__")
+
 
 class BromicHub:
     """Manages communication with Bromic Smart Heat Link device."""
@@ -46,10 +52,23 @@ class BromicHub:
         """
         self.hass = hass
         self.port = port
+        self.port_id = port.translate(_PORT_ID_TABLE)
+        # Normalized controller map (int keys), filled in by async_setup_entry
+        # so platforms share one typed copy instead of re-parsing options
+        self.controllers: dict[int, dict] = {}
+        # Timestamp of the last successful exchange, exposed directly so hot
+        # paths don't have to go through the stats mapping
+        self.last_success_ts: float | None = None
         self._serial: serial.Serial | None = None
-        self._lock = threading.RLock()
+        # Plain Lock: the two holders (_send_command_sync, _disconnect)
+        # never re-enter, so RLock's owner bookkeeping was pure overhead
+        self._lock = threading.Lock()
         self._connected = False
         self._last_command_time = 0.0
+        # Set when a transaction ends abnormally; the next send flushes the
+        # input buffer before writing (skipping the per-command ioctl
+        # otherwise, since a clean exchange leaves nothing behind)
+        self._dirty_rx = False
 
         # Statistics
         self._stats = {
@@ -70,9 +89,9 @@ class BromicHub:
         return self._connected
 
     @property
-    def stats(self) -> dict[str, Any]:
-        """Return hub statistics."""
-        return self._stats.copy()
+    def stats(self) -> Mapping[str, Any]:
+        """Return a read-only live view of hub statistics (no copy)."""
+        return MappingProxyType(self._stats)
 
     def add_connection_callback(self, callback: Callable[[bool], None]) -> None:
         """Add a callback for connection state changes."""
@@ -92,15 +111,24 @@ class BromicHub:
             except Exception:
                 _LOGGER.exception("Error in connection callback")
 
-    async def async_connect(self) -> None:
-        """Connect to the device."""
+    async def async_connect(self, *, verify: bool = False) -> None:
+        """
+        Connect to the device.
+
+        Args:
+            verify: Also run the communication probe after opening, fusing
+                the connect/test round-trips the config flow used to make
+                separately
+
+        """
         if self._connected:
             return
 
         try:
             await self.hass.async_add_executor_job(self._connect)
             self._connected = True
-            self._stats["last_success"] = time.time()
+            self.last_success_ts = time.time()
+            self._stats["last_success"] = self.last_success_ts
             _LOGGER.info("Connected to Bromic device on %s", self.port)
             self._notify_connection_state(connected=True)
 
@@ -112,14 +140,22 @@ class BromicHub:
             self._notify_connection_state(connected=False)
             raise BromicConnectionError from err
 
+        # Probe outcome is advisory only (assumed-state device); callers
+        # historically discarded the bool, so a failed probe is not fatal
+        if verify and not await self.async_test_connection():
+            _LOGGER.debug("Post-connect probe failed on %s", self.port)
+
     def _connect(self) -> None:
         """Connect to the serial port (sync)."""
         try:
             self._serial = serial.Serial(port=self.port, **SERIAL_CONFIG)
+            # Responses are awaited with a single blocking read(); let the
+            # kernel own the wait for the full command window
+            self._serial.timeout = COMMAND_TIMEOUT
 
-            # Clear any pending data
-            if self._serial.in_waiting > 0:
-                self._serial.read(self._serial.in_waiting)
+            # Discard any stale pending data in one tcflush; a capped read
+            # could leave garbage ahead of the first command's response
+            self._serial.reset_input_buffer()
 
         except serial.SerialException as err:
             message = f"Serial port error: {err}"
@@ -171,9 +207,21 @@ class BromicHub:
             message = "Not connected to device"
             raise BromicConnectionError(message)
 
+        # encode_command is a shared-instance table lookup since the
+        # protocol module pre-builds every sendable command at import
         command = BromicProtocol.encode_command(id_location, button_code)
 
         for attempt in range(retries + 1):
+            # Absorb the bulk of the inter-frame guard on the event loop so
+            # the executor thread isn't parked in time.sleep for it; the
+            # authoritative enforcement stays in _send_command_sync, which
+            # then has (close to) nothing left to sleep
+            pacing_wait = INTER_FRAME_DELAY - (
+                time.monotonic() - self._last_command_time
+            )
+            if pacing_wait > 0:
+                await asyncio.sleep(pacing_wait)
+
             try:
                 response = await self.hass.async_add_executor_job(
                     self._send_command_sync, command
@@ -199,7 +247,8 @@ class BromicHub:
             else:
                 if response.success:
                     self._stats["commands_successful"] += 1
-                    self._stats["last_success"] = time.time()
+                    self.last_success_ts = time.time()
+                    self._stats["last_success"] = self.last_success_ts
                     _LOGGER.debug(
                         "Command successful: ID=%d, Button=%d (attempt %d)",
                         id_location,
@@ -232,41 +281,79 @@ class BromicHub:
                 message = "Serial port not open"
                 raise BromicConnectionError(message)
 
-            # Enforce inter-frame delay
-            current_time = time.time()
-            time_since_last = current_time - self._last_command_time
+            # Enforce inter-frame delay (monotonic: immune to NTP steps)
+            time_since_last = time.monotonic() - self._last_command_time
             if time_since_last < INTER_FRAME_DELAY:
                 time.sleep(INTER_FRAME_DELAY - time_since_last)
 
             try:
-                # Clear any pending input
-                if self._serial.in_waiting > 0:
-                    self._serial.read(self._serial.in_waiting)
+                # Flush stale input only after an abnormal transaction; one
+                # tcflush then instead of an in_waiting ioctl per command
+                if self._dirty_rx:
+                    self._serial.reset_input_buffer()
+                    self._dirty_rx = False
 
                 # Send command
-                _LOGGER.debug("Sending: %s", command.raw_bytes.hex().upper())
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Sending: %s", command.raw_bytes.hex().upper())
                 self._serial.write(command.raw_bytes)
                 self._serial.flush()
 
-                self._last_command_time = time.time()
+                self._last_command_time = time.monotonic()
 
                 # Wait for response
                 response_data = self._read_response()
                 return BromicProtocol.decode_response(response_data)
 
             except serial.SerialTimeoutException as err:
+                self._dirty_rx = True
                 message = f"Command timeout: {err}"
                 raise BromicTimeoutError(message) from err
             except serial.SerialException as err:
                 # Connection may have been lost
                 self._connected = False
+                self._dirty_rx = True
                 message = f"Serial error: {err}"
                 raise BromicSerialError(message) from err
 
+    def _read_exactly(self, n: int, deadline: float) -> bytes:
+        """
+        Read exactly n bytes or as many as arrive before the deadline.
+
+        pyserial's per-call timeout restarts on every read(), so bytes
+        dribbling in across calls could stretch the wait well past the
+        command window; an absolute monotonic deadline keeps the total
+        bounded and survives wall-clock jumps.
+
+        Args:
+            n: Number of bytes to read
+            deadline: time.monotonic() value after which to give up
+
+        Returns:
+            Up to n bytes (short only if the deadline passed)
+
+        """
+        buf = b""
+        while len(buf) < n:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._serial.timeout = remaining
+            chunk = self._serial.read(n - len(buf))
+            if not chunk:
+                break
+            buf += chunk
+        return buf
+
     def _read_response(self) -> bytes:
         """
         Read response from device.
 
+        Blocking reads against an absolute deadline let the kernel wake the
+        executor thread the moment bytes arrive, and _read_exactly keeps
+        collecting if a frame dribbles in across reads. ACK and error frames
+        are both 3 bytes, so one sized read covers every response shape.
+
         Returns:
             Response bytes
 
@@ -278,26 +365,22 @@ class BromicHub:
             message = "Serial port not available"
             raise BromicConnectionError(message)
 
-        # Read response with timeout
-        start_time = time.time()
-        response = b""
-
-        while time.time() - start_time < COMMAND_TIMEOUT:
-            if self._serial.in_waiting > 0:
-                chunk = self._serial.read(self._serial.in_waiting)
-                response += chunk
-                _LOGGER.debug("Received chunk: %s", chunk.hex().upper())
-
-                # Check if we have a complete response
-                if len(response) >= 3:  # noqa: PLR2004
-                    # For ACK response (3 bytes) or error response (3+ bytes)
-                    _LOGGER.debug("Complete response: %s", response.hex().upper())
-                    return response
-            else:
-                time.sleep(0.01)  # Small delay to avoid busy waiting
+        deadline = time.monotonic() + COMMAND_TIMEOUT
+        response = self._read_exactly(MIN_STD_RESPONSE_LENGTH, deadline)
+
+        if len(response) >= MIN_STD_RESPONSE_LENGTH:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Complete response: %s", response.hex().upper())
+            return response
+
+        # Anything but a full frame means the line state is suspect; flush
+        # before the next command in case the remainder arrives late
+        self._dirty_rx = True
 
         if response:
-            _LOGGER.debug("Partial response: %s", response.hex().upper())
+            # Short read at timeout; hand the partial frame to the decoder
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Partial response: %s", response.hex().upper())
             return response
 
         message = "No response received from device"
@@ -324,10 +407,13 @@ class BromicHub:
         return True
 
     @staticmethod
-    async def discover_ports() -> list[dict[str, str]]:
+    async def discover_ports(hass: HomeAssistant) -> list[dict[str, str]]:
         """
         Discover available serial ports.
 
+        Args:
+            hass: Home Assistant instance (enumeration runs in its executor)
+
         Returns:
             List of port information dictionaries
 
@@ -336,10 +422,14 @@ class BromicHub:
         def _discover() -> list[dict[str, str]]:
             ports = []
             for port in serial.tools.list_ports.comports():
+                description = port.description or "Unknown"
                 port_info = {
                     "device": port.device,
                     "name": port.device,
-                    "description": port.description or "Unknown",
+                    "description": description,
+                    # Pre-formatted form label; built once here so config-flow
+                    # re-renders don't re-format it per port
+                    "label": f"{port.device} - {description}",
                 }
 
                 # Add vendor/product info if available
@@ -360,14 +450,43 @@ class BromicHub:
 
             return sorted(ports, key=lambda x: x["device"])
 
-        return await asyncio.get_event_loop().run_in_executor(None, _discover)
+        return await hass.async_add_executor_job(_discover)
+
+    @staticmethod
+    async def async_validate_port(hass: HomeAssistant, port: str) -> bool:
+        """
+        Cheaply check that a port node exists and can be opened.
+
+        A raw non-blocking os.open/close costs ~1ms versus a full
+        serial.Serial init, so validation paths can fail fast before
+        paying for a real connect.
+
+        Args:
+            hass: Home Assistant instance
+            port: Port path to probe
+
+        Returns:
+            True if the device node could be opened
+
+        """
+
+        def _probe() -> bool:
+            try:
+                fd = os.open(port, os.O_RDWR | os.O_NONBLOCK | os.O_NOCTTY)
+            except OSError:
+                return False
+            os.close(fd)
+            return True
+
+        return await hass.async_add_executor_job(_probe)
 
     @staticmethod
-    async def test_port(port: str) -> bool:
+    async def test_port(hass: HomeAssistant, port: str) -> bool:
         """
         Test if a port can be opened.
 
         Args:
+            hass: Home Assistant instance
             port: Port path to test
 
         Returns:
@@ -382,4 +501,4 @@ class BromicHub:
             except Exception:  # noqa: BLE001
                 return False
 
-        return await asyncio.get_event_loop().run_in_executor(None, _test)
+        return await hass.async_add_executor_job(_test)
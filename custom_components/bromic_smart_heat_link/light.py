@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from contextlib import suppress
+from bisect import bisect_left
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEntity
@@ -11,16 +12,16 @@ from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEnti
 from .const import (
     BRIGHTNESS_LEVELS,
     CONF_CONTROLLER_TYPE,
-    CONF_CONTROLLERS,
     CONF_LEARNED_BUTTONS,
     CONTROLLER_TYPE_DIMMER,
-    DIMMER_BUTTONS,
-    DOMAIN,
+    DIMMER_BUTTON_NAMES,
     OFF_BUTTON_CODE,
 )
 from .entity import BromicEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -30,6 +31,11 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# One command at a time: every entity shares the single RS-232 link, so
+# letting HA fire service calls concurrently just piles coroutines onto the
+# hub's lock and spikes tail latency during scene activation
+PARALLEL_UPDATES = 1
+
 # Discrete brightness levels for the dimmer (0-255 mapped to power levels)
 DISCRETE_BRIGHTNESS_LEVELS = {
     0: "Off",  # Off
@@ -42,50 +48,75 @@ DISCRETE_BRIGHTNESS_LEVELS = {
 # Reverse mapping for power level names to brightness
 POWER_LEVEL_TO_BRIGHTNESS = {v: k for k, v in DISCRETE_BRIGHTNESS_LEVELS.items()}
 
+# HA's full-scale brightness (the default for turn_on without kwargs)
+FULL_BRIGHTNESS = 255
+
+# A dimmer light needs all of 100%, 75%, 50%, 25% and Off learned
+REQUIRED_DIMMER_BUTTONS = (1, 2, 3, 4, OFF_BUTTON_CODE)
+
+# Same requirement as a bitmask (button codes fit in 8 bits), so the setup
+# check is two int ops instead of a generator over dict.get calls
+_REQUIRED_DIMMER_MASK = 0
+for _button in REQUIRED_DIMMER_BUTTONS:
+    _REQUIRED_DIMMER_MASK |= 1 << _button
+del _button
+
+# (code, stringified code, name) rows for the state-attribute dicts, which
+# use string keys: stringify once at import instead of per entity
+_LEVEL_ATTR_ROWS = tuple(
+    (brightness, str(brightness), name)
+    for brightness, name in DISCRETE_BRIGHTNESS_LEVELS.items()
+)
+_BUTTON_ATTR_ROWS = tuple(
+    (code, str(code), name) for code, name in DIMMER_BUTTON_NAMES.items()
+)
+
+# (brightness, button) pairs resolved once at import; per-entity init just
+# filters this shared tuple against the controller's learned buttons
+_BRIGHTNESS_BUTTON_PAIRS = tuple(
+    (brightness, BRIGHTNESS_LEVELS[brightness]["button"])
+    for brightness in DISCRETE_BRIGHTNESS_LEVELS
+)
+
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001 - platform setup signature
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bromic light entities from a config entry."""
-    hub_data = hass.data[DOMAIN][config_entry.entry_id]
-    hub: BromicHub = hub_data["hub"]
+    hub: BromicHub = config_entry.runtime_data
 
-    entities = []
-    controllers = config_entry.options.get(CONF_CONTROLLERS, {})
-
-    for id_str, controller_info in controllers.items():
-        id_location = int(id_str)
-        controller_type = controller_info[CONF_CONTROLLER_TYPE]
-        learned_buttons = controller_info.get(CONF_LEARNED_BUTTONS, {})
-        # Normalize keys from storage (JSON) which may be strings
-        with suppress(Exception):
-            learned_buttons = {int(k): v for k, v in learned_buttons.items()}
-
-        # Only create a single light for dimmer controllers
-        if controller_type == CONTROLLER_TYPE_DIMMER:
-            # Check if we have the required buttons learned
-            required_buttons = [1, 2, 3, 4, OFF_BUTTON_CODE]  # 100%, 75%, 50%, 25%, Off
-            has_required_buttons = all(
-                learned_buttons.get(btn, False) for btn in required_buttons
-            )
+    # hub.controllers is already normalized (int keys) at entry setup;
+    # prefilter dimmers since a light is only created for those
+    dimmer_items = [
+        (id_location, controller_info)
+        for id_location, controller_info in hub.controllers.items()
+        if controller_info[CONF_CONTROLLER_TYPE] == CONTROLLER_TYPE_DIMMER
+    ]
 
-            if has_required_buttons:
-                entities.append(
-                    BromicLight(
-                        hub=hub,
-                        id_location=id_location,
-                        controller_type=controller_type,
-                        learned_buttons=learned_buttons,
-                    )
-                )
-            else:
-                _LOGGER.warning(
-                    "Skipping light ID%d - not all required buttons learned "
-                    "(100%%, 75%%, 50%%, 25%%, Off)",
-                    id_location,
+    entities = []
+    for id_location, controller_info in dimmer_items:
+        learned_buttons = controller_info[CONF_LEARNED_BUTTONS]
+        learned_mask = 0
+        for button, is_learned in learned_buttons.items():
+            if is_learned:
+                learned_mask |= 1 << button
+        if learned_mask & _REQUIRED_DIMMER_MASK == _REQUIRED_DIMMER_MASK:
+            entities.append(
+                BromicLight(
+                    hub=hub,
+                    id_location=id_location,
+                    controller_type=CONTROLLER_TYPE_DIMMER,
+                    learned_buttons=learned_buttons,
                 )
+            )
+        else:
+            _LOGGER.warning(
+                "Skipping light ID%d - not all required buttons learned "
+                "(100%%, 75%%, 50%%, 25%%, Off)",
+                id_location,
+            )
 
     if entities:
         async_add_entities(entities)
@@ -94,6 +125,17 @@ async def async_setup_entry(
 class BromicLight(BromicEntity, LightEntity):
     """Representation of a Bromic dimmer controller light with discrete power levels."""
 
+    # Slot the attributes this subclass introduces, matching BromicEntity.
+    # HA's Entity still provides __dict__ for the _attr_* machinery.
+    __slots__ = (
+        "_brightness_to_button",
+        "_learned_buttons",
+        "_level_thresholds",
+        "_light_attrs",
+        "_merged_attrs",
+        "_sorted_levels",
+    )
+
     def __init__(
         self,
         hub: BromicHub,
@@ -126,44 +168,71 @@ class BromicLight(BromicEntity, LightEntity):
         # Keep entity name None so object_id derives from device name
         self._attr_name = None
 
-        # Create mapping of brightness levels to button codes
-        self._brightness_to_button = {}
-        for brightness in DISCRETE_BRIGHTNESS_LEVELS:
-            if brightness == 0:
-                button = OFF_BUTTON_CODE
-            else:
-                # Map brightness to button (255->1, 191->2, 128->3, 64->4)
-                button = BRIGHTNESS_LEVELS[brightness]["button"]
+        # Map brightness levels to button codes: filter the shared
+        # import-time pairs against this controller's learned buttons
+        learned = frozenset(
+            button for button, is_learned in learned_buttons.items() if is_learned
+        )
+        self._brightness_to_button = {
+            brightness: button
+            for brightness, button in _BRIGHTNESS_BUTTON_PAIRS
+            if button in learned
+        }
+
+        # Both overlay attributes are fixed for the entity's lifetime
+        # (learned buttons only change via a reload), so build them once
+        # instead of on every state read
+        # Sorted non-zero levels plus midpoint thresholds, so brightness
+        # mapping is a single bisect instead of a per-call min() scan
+        self._sorted_levels = tuple(
+            sorted(b for b in self._brightness_to_button if b > 0)
+        )
+        self._level_thresholds = tuple(
+            (a + b) // 2
+            for a, b in zip(self._sorted_levels, self._sorted_levels[1:], strict=False)
+        )
 
-            if self._learned_buttons.get(button, False):
-                self._brightness_to_button[brightness] = button
+        self._light_attrs = {
+            "available_power_levels": {
+                key: name
+                for brightness, key, name in _LEVEL_ATTR_ROWS
+                if brightness in self._brightness_to_button
+            },
+            "learned_buttons": {
+                key: name
+                for code, key, name in _BUTTON_ATTR_ROWS
+                if self._learned_buttons.get(code)
+            },
+        }
+        # Merged base+light attrs view; rebuilt lazily after a command
+        # invalidates the base cache
+        self._merged_attrs: Mapping[str, Any] | None = None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return light specific state attributes."""
-        attrs = super().extra_state_attributes
-        attrs.update(
-            {
-                "available_power_levels": {
-                    str(brightness): level_name
-                    for brightness, level_name in DISCRETE_BRIGHTNESS_LEVELS.items()
-                    if brightness in self._brightness_to_button
-                },
-                "learned_buttons": {
-                    str(button): DIMMER_BUTTONS[button]["name"]
-                    for button, learned in self._learned_buttons.items()
-                    if learned
-                },
-            }
-        )
-        return attrs
+        if self._merged_attrs is None or self._attrs_cache is None:
+            # super() rebuilds (and re-caches) the base attrs when stale;
+            # overlay the static light attrs and freeze the merged result so
+            # repeat reads are zero-allocation
+            attrs = super().extra_state_attributes
+            attrs.update(self._light_attrs)
+            self._merged_attrs = MappingProxyType(attrs)
+        return self._merged_attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
         brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
 
-        # Map HA brightness to closest available discrete level
-        target_brightness = self._map_brightness_to_discrete(brightness)
+        # Fast path for the default full-on case; otherwise map the HA
+        # brightness to the closest available discrete level
+        if (
+            brightness == FULL_BRIGHTNESS
+            and FULL_BRIGHTNESS in self._brightness_to_button
+        ):
+            target_brightness = FULL_BRIGHTNESS
+        else:
+            target_brightness = self._map_brightness_to_discrete(brightness)
 
         if target_brightness not in self._brightness_to_button:
             _LOGGER.warning(
@@ -175,16 +244,20 @@ class BromicLight(BromicEntity, LightEntity):
 
         button = self._brightness_to_button[target_brightness]
 
-        _LOGGER.debug(
-            "Turning ON: %s (Brightness %d -> %s, Button %d)",
-            self.entity_id,
-            brightness,
-            DISCRETE_BRIGHTNESS_LEVELS[target_brightness],
-            button,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Turning ON: %s (Brightness %d -> %s, Button %d)",
+                self.entity_id,
+                brightness,
+                DISCRETE_BRIGHTNESS_LEVELS[target_brightness],
+                button,
+            )
 
         success = await self.async_send_command(button)
         if success:
+            # Always write: even when (is_on, brightness) is unchanged the
+            # command bumped the stats attributes, and re-confirming an
+            # assumed state has value of its own
             self._attr_is_on = target_brightness > 0
             self._attr_brightness = target_brightness
             self.async_write_ha_state()
@@ -220,10 +293,9 @@ class BromicLight(BromicEntity, LightEntity):
         if brightness == 0:
             return 0
 
-        # Find closest available discrete level
-        available_brightnesses = [b for b in self._brightness_to_button if b > 0]
-        if not available_brightnesses:
+        if not self._sorted_levels:
             return 255  # Fallback to max if no levels available
 
-        # Find closest match
-        return min(available_brightnesses, key=lambda x: abs(x - brightness))
+        # Bisect over the precomputed midpoints; a value exactly on a floor
+        # midpoint resolves to the lower level, matching the old min() scan
+        return self._sorted_levels[bisect_left(self._level_thresholds, brightness)]
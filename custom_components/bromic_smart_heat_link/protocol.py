@@ -7,14 +7,16 @@ from typing import NamedTuple
 
 from .const import (
     ACK_RESPONSE,
+    ACK_RESPONSE_INT,
     COMMAND_BYTE,
-    ERROR_CODES,
     ERROR_COMMAND,
     ERROR_RESPONSE_LENGTH,
     MAX_BUTTON_CODE,
     MAX_ID_LOCATION,
     MIN_FRAME_LENGTH,
+    MIN_ID_LOCATION,
     MIN_STD_RESPONSE_LENGTH,
+    error_message,
 )
 from .exceptions import (
     BromicChecksumError,
@@ -25,6 +27,47 @@ from .exceptions import (
 _LOGGER = logging.getLogger(__name__)
 
 
+# Strips the separators accepted in hex command strings in one C-level pass
+_HEX_STRIP = str.maketrans("", "", " :")
+
+
+def _checksum5(data: bytes) -> int:
+    """Checksum specialized for the fixed 6-byte frame (sum of bytes 0-4)."""
+    return (data[0] + data[1] + data[2] + data[3] + data[4]) & 0xFF
+
+
+def _build_frame(id_location: int, button_code: int) -> bytes:
+    """Build one 6-byte command frame (T + ID + button + checksum)."""
+    frame_data = (
+        bytes([COMMAND_BYTE])
+        + id_location.to_bytes(2, "big")
+        + button_code.to_bytes(2, "big")
+    )
+    return frame_data + bytes([sum(frame_data) & 0xFF])
+
+
+# The full command space is only 50 IDs x 8 buttons, so every possible frame
+# is built once at import and encode_command collapses to a dict lookup
+_FRAME_TABLE: dict[tuple[int, int], bytes] = {
+    (id_location, button_code): _build_frame(id_location, button_code)
+    for id_location in range(MIN_ID_LOCATION, MAX_ID_LOCATION + 1)
+    for button_code in range(1, MAX_BUTTON_CODE + 1)
+}
+
+# The matching immutable BromicCommand carriers, so the encode hot path
+# returns a shared instance with zero per-call allocation
+_COMMAND_TABLE: dict[tuple[int, int], BromicCommand] = {}
+
+# Documentation examples depend on nothing but the frame table; build them
+# once and hand out the shared dict (treated as read-only by callers)
+_EXAMPLES: dict[int, dict[int, str]] = {
+    id_loc: {
+        button: _FRAME_TABLE[(id_loc, button)].hex().upper() for button in range(1, 8)
+    }
+    for id_loc in range(1, 5)
+}
+
+
 class BromicCommand(NamedTuple):
     """Represents a Bromic command."""
 
@@ -42,6 +85,19 @@ class BromicResponse(NamedTuple):
     raw_bytes: bytes
 
 
+_COMMAND_TABLE.update(
+    {key: BromicCommand(*key, raw) for key, raw in _FRAME_TABLE.items()}
+)
+
+# Every ACK decodes to the same immutable payload; share one instance
+_ACK_RESPONSE_OBJ = BromicResponse(
+    success=True,
+    error_code=None,
+    message="Command acknowledged",
+    raw_bytes=ACK_RESPONSE,
+)
+
+
 class BromicProtocol:
     """Handles Bromic Smart Heat Link protocol encoding/decoding."""
 
@@ -81,42 +137,40 @@ class BromicProtocol:
             BromicProtocolError: If parameters are invalid
 
         """
-        if not (1 <= id_location <= MAX_ID_LOCATION):
-            message = f"Invalid ID location: {id_location}"
-            raise BromicProtocolError(message)
-
-        if not (1 <= button_code <= MAX_BUTTON_CODE):
+        command = _COMMAND_TABLE.get((id_location, button_code))
+        if command is None:
+            if not (MIN_ID_LOCATION <= id_location <= MAX_ID_LOCATION):
+                message = f"Invalid ID location: {id_location}"
+                raise BromicProtocolError(message)
             message = f"Invalid button code: {button_code}"
             raise BromicProtocolError(message)
 
-        # Build the frame
-        cmd_byte = COMMAND_BYTE
-        id_bytes = id_location.to_bytes(2, "big")
-        button_bytes = button_code.to_bytes(2, "big")
-
-        # Calculate checksum of all bytes
-        frame_data = bytes([cmd_byte]) + id_bytes + button_bytes
-        checksum = BromicProtocol.calculate_checksum(frame_data)
-
-        # Complete frame
-        raw_bytes = frame_data + bytes([checksum])
-
-        _LOGGER.debug(
-            "Encoded command: ID=%d, Button=%d -> %s",
-            id_location,
-            button_code,
-            raw_bytes.hex().upper(),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Encoded command: ID=%d, Button=%d -> %s",
+                id_location,
+                button_code,
+                command.raw_bytes.hex().upper(),
+            )
 
-        return BromicCommand(
-            id_location=id_location, button_code=button_code, raw_bytes=raw_bytes
-        )
+        return command
 
     @staticmethod
-    def decode_response(data: bytes) -> BromicResponse:
+    def decode_response(
+        data: bytes,
+        *,
+        _ack_int: int = ACK_RESPONSE_INT,
+        _error_cmd: int = ERROR_COMMAND,
+        _error_len: int = ERROR_RESPONSE_LENGTH,
+        _min_len: int = MIN_STD_RESPONSE_LENGTH,
+    ) -> BromicResponse:
         """
         Decode a response from the device.
 
+        The keyword-only parameters are private: they bind the protocol
+        constants as locals so the per-response hot path avoids repeated
+        module-global lookups. Callers pass only ``data``.
+
         Args:
             data: Raw response bytes
 
@@ -133,35 +187,32 @@ class BromicProtocol:
             message = "Empty response received"
             raise BromicInvalidResponseError(message)
 
-        _LOGGER.debug("Decoding response: %s", data.hex().upper())
-
-        # Check for ACK response (success)
-        if data == ACK_RESPONSE:
-            return BromicResponse(
-                success=True,
-                error_code=None,
-                message="Command acknowledged",
-                raw_bytes=data,
-            )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Decoding response: %s", data.hex().upper())
 
-        # Check for error response
-        if len(data) >= ERROR_RESPONSE_LENGTH and data[0] == ERROR_COMMAND:
+        # Error frames fast-fail on a single byte compare ('E' leader);
+        # ACK frames never start with it (0x54), so order doesn't overlap
+        if len(data) >= _error_len and data[0] == _error_cmd:
             error_code = data[1] if len(data) > 1 else 0
-            error_message = ERROR_CODES.get(
-                error_code, f"Unknown error code: {error_code:02X}"
-            )
+            message = error_message(error_code)
 
-            _LOGGER.warning("Device error: %s (code: %02X)", error_message, error_code)
+            _LOGGER.warning("Device error: %s (code: %02X)", message, error_code)
 
             return BromicResponse(
                 success=False,
                 error_code=error_code,
-                message=error_message,
+                message=message,
                 raw_bytes=data,
             )
 
+        # Check for ACK (success): one packed-int compare against the 3-byte
+        # frame instead of a bytes-object equality per call. Length-guarded
+        # so an ACK prefix on a longer frame still falls through.
+        if len(data) == _min_len and int.from_bytes(data, "big") == _ack_int:
+            return _ACK_RESPONSE_OBJ
+
         # Validate minimum length for standard response
-        if len(data) < MIN_STD_RESPONSE_LENGTH:
+        if len(data) < _min_len:
             message = f"Response too short: {len(data)} bytes"
             raise BromicInvalidResponseError(message)
 
@@ -190,6 +241,9 @@ class BromicProtocol:
         """
         Validate a complete frame.
 
+        None of the checks can raise for a ``bytes`` input (the short-length
+        case returns before any indexing), so there is no exception guard.
+
         Args:
             data: Frame data to validate
 
@@ -197,21 +251,14 @@ class BromicProtocol:
             True if frame is valid, False otherwise
 
         """
-        try:
-            if len(data) < MIN_FRAME_LENGTH:  # Minimum frame size
-                return False
-
-            if data[0] != COMMAND_BYTE:
-                return False
-
-            # Validate checksum
-            received_checksum = data[-1]
-            calculated_checksum = BromicProtocol.calculate_checksum(data[:-1])
-
-        except Exception:  # noqa: BLE001
+        if len(data) < MIN_FRAME_LENGTH or data[0] != COMMAND_BYTE:
             return False
-        else:
-            return received_checksum == calculated_checksum
+
+        # The exact 6-byte shape (the only real frame size) takes the
+        # unrolled fast path, longer frames stay generic
+        if len(data) == MIN_FRAME_LENGTH:
+            return data[5] == _checksum5(data)
+        return data[-1] == (sum(data[:-1]) & 0xFF)
 
     @staticmethod
     def get_command_examples() -> dict[int, dict[int, str]]:
@@ -222,19 +269,7 @@ class BromicProtocol:
             Dictionary mapping ID locations to button codes to hex strings
 
         """
-        examples = {}
-
-        # Generate examples for first few IDs
-        for id_loc in range(1, 5):
-            examples[id_loc] = {}
-            for button in range(1, 8):
-                try:
-                    cmd = BromicProtocol.encode_command(id_loc, button)
-                    examples[id_loc][button] = cmd.raw_bytes.hex().upper()
-                except BromicProtocolError:
-                    pass
-
-        return examples
+        return _EXAMPLES
 
     @staticmethod
     def parse_hex_command(hex_string: str) -> BromicCommand | None:
@@ -249,27 +284,23 @@ class BromicProtocol:
 
         """
         try:
-            # Remove spaces and convert to bytes
-            hex_clean = hex_string.replace(" ", "").replace(":", "")
-            data = bytes.fromhex(hex_clean)
-
-            if len(data) != MIN_FRAME_LENGTH:
-                return None
-
-            if data[0] != COMMAND_BYTE:
-                return None
-
-            # Validate checksum
-            if not BromicProtocol.validate_frame(data):
-                return None
-
-            # Extract ID and button
-            id_location = int.from_bytes(data[1:3], "big")
-            button_code = int.from_bytes(data[3:5], "big")
-
-            return BromicCommand(
-                id_location=id_location, button_code=button_code, raw_bytes=data
-            )
+            data = bytes.fromhex(hex_string.translate(_HEX_STRIP))
+        except ValueError:
+            return None
 
-        except ValueError, IndexError:
+        # Combined shape check for the fixed 6-byte frame: length, leader
+        # byte and unrolled checksum in one expression, no validate_frame
+        # round trip
+        if (
+            len(data) != MIN_FRAME_LENGTH
+            or data[0] != COMMAND_BYTE
+            or data[5] != _checksum5(data)
+        ):
             return None
+
+        # Extract ID and button via int indexing (no slice allocation)
+        return BromicCommand(
+            id_location=(data[1] << 8) | data[2],
+            button_code=(data[3] << 8) | data[4],
+            raw_bytes=data,
+        )
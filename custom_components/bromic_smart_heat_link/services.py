@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
@@ -20,6 +21,7 @@ from .const import (
     SERVICE_LEARN_BUTTON,
     SERVICE_SEND_RAW_COMMAND,
 )
+from .exceptions import BromicError
 from .protocol import BromicProtocol
 
 if TYPE_CHECKING:
@@ -31,23 +33,61 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Non-entry key in hass.data[DOMAIN] caching the last connected hub so
+# service calls skip the per-call scan over all entries
+_ACTIVE_HUB_KEY = "_active_hub"
+
+# Cheap pre-filter for raw commands: every string the protocol parser can
+# accept has at least 12 characters drawn from this class, so anything else
+# is rejected by one compiled-regex match instead of the parser's
+# fromhex/ValueError path. \s is included because bytes.fromhex skips ASCII
+# whitespace (YAML/templates often append a newline); it's a slight superset
+# of what the parser takes, and strings that pass still get fully validated.
+_RAW_HEX_RE = re.compile(r"[0-9A-Fa-f\s:]{12,}")
+
+MAX_LEARN_BUTTON = 7
+
+
+def _bounded_int(name: str, minimum: int, maximum: int) -> Callable[[object], int]:
+    """
+    Build a flat integer-range validator.
+
+    One coercion plus one comparison chain per call, replacing the
+    vol.All(cv.positive_int, vol.Range(...)) stack of nested voluptuous
+    wrappers on the service dispatch path.
+    """
+
+    def validate(value: object) -> int:
+        try:
+            result = int(value)  # type: ignore[call-overload]
+        except (TypeError, ValueError) as err:
+            message = f"expected an integer for {name}, got {value!r}"
+            raise vol.Invalid(message) from err
+        if not (minimum <= result <= maximum):
+            message = f"{name} must be between {minimum} and {maximum}"
+            raise vol.Invalid(message)
+        return result
+
+    return validate
+
+
+_ID_LOCATION_VALIDATOR = _bounded_int(
+    ATTR_ID_LOCATION, MIN_ID_LOCATION, MAX_ID_LOCATION
+)
+
 # Service schemas
 LEARN_BUTTON_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_ID_LOCATION): vol.All(
-            cv.positive_int, vol.Range(min=MIN_ID_LOCATION, max=MAX_ID_LOCATION)
-        ),
-        vol.Required(ATTR_BUTTON_NUMBER): vol.All(
-            cv.positive_int, vol.Range(min=1, max=7)
+        vol.Required(ATTR_ID_LOCATION): _ID_LOCATION_VALIDATOR,
+        vol.Required(ATTR_BUTTON_NUMBER): _bounded_int(
+            ATTR_BUTTON_NUMBER, 1, MAX_LEARN_BUTTON
         ),
     }
 )
 
 CLEAR_CONTROLLER_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_ID_LOCATION): vol.All(
-            cv.positive_int, vol.Range(min=MIN_ID_LOCATION, max=MAX_ID_LOCATION)
-        ),
+        vol.Required(ATTR_ID_LOCATION): _ID_LOCATION_VALIDATOR,
     }
 )
 
@@ -74,12 +114,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:  # noqa: PLR0915
 
         try:
             response = await hub.async_send_command(id_location, button_number)
-        except Exception as err:
-            _LOGGER.exception(
-                "Button learning exception: ID=%d, Button=%d",
-                id_location,
-                button_number,
-            )
+        except (BromicError, OSError, TimeoutError) as err:
+            # Expected transport failures; ServiceValidationError carries the
+            # message to the caller and HA logs it, so no extra traceback here
             message = f"Learning failed: {err}"
             raise ServiceValidationError(message) from err
         else:
@@ -126,8 +163,12 @@ async def async_setup_services(hass: HomeAssistant) -> None:  # noqa: PLR0915
             message = "No Bromic device connected"
             raise ServiceValidationError(message)
 
-        # Parse the raw command
-        command = BromicProtocol.parse_hex_command(raw_command)
+        # Parse the raw command (regex pre-filter, then full validation)
+        command = (
+            BromicProtocol.parse_hex_command(raw_command)
+            if _RAW_HEX_RE.fullmatch(raw_command)
+            else None
+        )
         if not command:
             message = f"Invalid raw command format: {raw_command}"
             raise ServiceValidationError(message)
@@ -136,8 +177,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:  # noqa: PLR0915
             response = await hub.async_send_command(
                 command.id_location, command.button_code
             )
-        except Exception as err:
-            _LOGGER.exception("Raw command exception: %s", raw_command)
+        except (BromicError, OSError, TimeoutError) as err:
             message = f"Command failed: {err}"
             raise ServiceValidationError(message) from err
         else:
@@ -204,12 +244,22 @@ async def async_remove_services(hass: HomeAssistant) -> None:
 
 def _get_hub(hass: HomeAssistant) -> BromicHub | None:
     """Get the first available Bromic hub."""
-    domain_data = hass.data.get(DOMAIN, {})
-
-    for entry_data in domain_data.values():
-        if isinstance(entry_data, dict) and "hub" in entry_data:
-            hub: BromicHub = entry_data["hub"]
-            if hub.connected:
-                return hub
-
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
+        return None
+
+    # Fast path: the hub that served the last call, still connected. The
+    # connected check self-invalidates the cache across disconnects/unloads.
+    hub = domain_data.get(_ACTIVE_HUB_KEY)
+    if hub is not None and hub.connected:
+        return hub
+
+    # Entries store the hub directly; non-hub values (e.g. the services
+    # lock) have no `connected` attribute and are skipped
+    for hub in domain_data.values():
+        if getattr(hub, "connected", False):
+            domain_data[_ACTIVE_HUB_KEY] = hub
+            return hub
+
+    domain_data.pop(_ACTIVE_HUB_KEY, None)
     return None
@@ -3,18 +3,15 @@
 from __future__ import annotations
 
 import logging
-from contextlib import suppress
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
 
 from .const import (
     CONF_CONTROLLER_TYPE,
-    CONF_CONTROLLERS,
     CONF_LEARNED_BUTTONS,
     CONTROLLER_TYPE_ONOFF,
-    DOMAIN,
-    ONOFF_BUTTONS,
+    ONOFF_BUTTON_NAMES,
 )
 from .entity import BromicEntity
 
@@ -28,50 +25,50 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# One command at a time: every entity shares the single RS-232 link, so
+# letting HA fire service calls concurrently just piles coroutines onto the
+# hub's lock and spikes tail latency during scene activation
+PARALLEL_UPDATES = 1
+
+# Fixed button assignment for ON/OFF controllers
+_ON_BUTTON = 1
+_OFF_BUTTON = 2
+
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001 - platform setup signature
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bromic switch entities from a config entry."""
-    hub_data = hass.data[DOMAIN][config_entry.entry_id]
-    hub: BromicHub = hub_data["hub"]
+    hub: BromicHub = config_entry.runtime_data
 
     entities = []
-    controllers = config_entry.options.get(CONF_CONTROLLERS, {})
 
-    for id_str, controller_info in controllers.items():
-        id_location = int(id_str)
-        controller_type = controller_info[CONF_CONTROLLER_TYPE]
+    # hub.controllers is already normalized (int keys) at entry setup; only
+    # ON/OFF controllers get a switch, one aggregate entity per controller
+    for id_location, controller_info in hub.controllers.items():
+        if controller_info[CONF_CONTROLLER_TYPE] != CONTROLLER_TYPE_ONOFF:
+            continue
+
         learned_buttons = controller_info.get(CONF_LEARNED_BUTTONS, {})
-        # Normalize keys from storage (JSON) which may be strings
-        with suppress(Exception):
-            learned_buttons = {int(k): v for k, v in learned_buttons.items()}
-
-        # Only create a single aggregate switch for ON/OFF controllers
-        if controller_type == CONTROLLER_TYPE_ONOFF:
-            on_button, off_button = 1, 2
-            if learned_buttons.get(on_button) and learned_buttons.get(off_button):
-                entities.append(
-                    BromicSwitch(
-                        hub=hub,
-                        id_location=id_location,
-                        controller_type=controller_type,
-                        on_button=on_button,
-                        off_button=off_button,
-                    )
-                )
-            else:
-                _LOGGER.warning(
-                    (
-                        "Skipping switch ID%d - required buttons not learned "
-                        "(ON=%d, OFF=%d)"
-                    ),
-                    id_location,
-                    on_button,
-                    off_button,
+        if learned_buttons.get(_ON_BUTTON) and learned_buttons.get(_OFF_BUTTON):
+            entities.append(
+                BromicSwitch(
+                    hub=hub,
+                    id_location=id_location,
+                    controller_type=CONTROLLER_TYPE_ONOFF,
+                    on_button=_ON_BUTTON,
+                    off_button=_OFF_BUTTON,
                 )
+            )
+        else:
+            _LOGGER.warning(
+                "Skipping switch ID%d - required buttons not learned (ON=%d, OFF=%d)",
+                id_location,
+                _ON_BUTTON,
+                _OFF_BUTTON,
+            )
 
     if entities:
         async_add_entities(entities)
@@ -80,6 +77,14 @@ async def async_setup_entry(
 class BromicSwitch(BromicEntity, SwitchEntity):
     """Representation of a Bromic ON/OFF controller switch."""
 
+    # Slot the attributes this subclass introduces, matching BromicEntity.
+    # HA's Entity still provides __dict__ for the _attr_* machinery.
+    __slots__ = (
+        "_off_button",
+        "_on_button",
+        "_switch_attrs",
+    )
+
     def __init__(
         self,
         hub: BromicHub,
@@ -110,20 +115,22 @@ class BromicSwitch(BromicEntity, SwitchEntity):
 
         # Name already set by base class (no channel)
 
+        # Button assignments never change for the entity's lifetime, so the
+        # attribute overlay is built once instead of per state read
+        self._switch_attrs = {
+            "on_button": on_button,
+            "off_button": off_button,
+            "button_names": {
+                on_button: ONOFF_BUTTON_NAMES[on_button],
+                off_button: ONOFF_BUTTON_NAMES[off_button],
+            },
+        }
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return switch specific state attributes."""
         attrs = super().extra_state_attributes
-        attrs.update(
-            {
-                "on_button": self._on_button,
-                "off_button": self._off_button,
-                "button_names": {
-                    self._on_button: ONOFF_BUTTONS[self._on_button]["name"],
-                    self._off_button: ONOFF_BUTTONS[self._off_button]["name"],
-                },
-            }
-        )
+        attrs.update(self._switch_attrs)
         return attrs
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
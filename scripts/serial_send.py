@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
-"""
+r"""
 Send a Bromic raw command over a TTY and print the hex reply.
 
 Usage examples:
   scripts/serial_send.py /dev/pts/8 --raw 540001000156
   scripts/serial_send.py /dev/pts/8 --id 1 --code 0x08
+  printf '540001000156\n54000100085D\n' | scripts/serial_send.py /dev/pts/8 --batch
 """
 
 from __future__ import annotations
 
 import argparse
-import binascii
+import struct
 import sys
+import time
 
 import serial
 
@@ -27,6 +29,10 @@ def calculate_checksum(data: bytes) -> int:
 MAX_TEST_ID = 2000
 MAX_CODE = 0xFFFF
 
+# Frame header packer: leader byte + big-endian ID + big-endian code in one
+# C-level pack call instead of two to_bytes and three concatenations
+_FRAME_HEADER = struct.Struct(">BHH")
+
 
 def build_frame_from_id_code(id_location: int, code: int) -> bytes:
     """Build a Bromic frame for an ID/code pair."""
@@ -36,12 +42,10 @@ def build_frame_from_id_code(id_location: int, code: int) -> bytes:
     if not (0 <= code <= MAX_CODE):
         message = "code out of range"
         raise ValueError(message)
-    cmd = 0x54
-    id_bytes = id_location.to_bytes(2, "big")
-    code_bytes = code.to_bytes(2, "big")
-    frame_wo_ck = bytes([cmd]) + id_bytes + code_bytes
-    checksum = calculate_checksum(frame_wo_ck)
-    return frame_wo_ck + bytes([checksum])
+    head = _FRAME_HEADER.pack(0x54, id_location, code)
+    # Unrolled for the fixed 5-byte header: skips the sum() iterator
+    checksum = (head[0] + head[1] + head[2] + head[3] + head[4]) & 0xFF
+    return head + bytes([checksum])
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -51,6 +55,12 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument("--raw", help="Raw hex frame, e.g., 540001000156")
     group.add_argument("--id", type=int, help="ID location (1-2000)")
+    group.add_argument(
+        "--batch",
+        action="store_true",
+        help="Read hex frames from stdin (one per line) over a single "
+        "port open, printing one hex reply per line",
+    )
     parser.add_argument("--code", help="Button/code (decimal or 0x..) when using --id")
     parser.add_argument(
         "--read-bytes", type=int, default=16, help="Max bytes to read (default 16)"
@@ -58,17 +68,48 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _read_reply(s: serial.Serial, read_bytes: int) -> bytes:
+    """
+    Read up to read_bytes, returning as soon as the device goes quiet.
+
+    A plain s.read(n) blocks for the full port timeout waiting for n bytes
+    even when the (shorter) reply arrived within milliseconds; polling
+    in_waiting and bailing once buffered data stops growing removes that
+    ~1s tail per command.
+    """
+    deadline = time.monotonic() + TIMEOUT_S
+    buf = bytearray()
+    while time.monotonic() < deadline and len(buf) < read_bytes:
+        n = s.in_waiting
+        if n:
+            buf += s.read(min(n, read_bytes - len(buf)))
+        elif buf:
+            break  # device finished transmitting
+        else:
+            time.sleep(0.001)
+    return bytes(buf)
+
+
+def _send_frame(s: serial.Serial, frame: bytes, read_bytes: int) -> str:
+    """Write one frame and return the hex reply."""
+    s.reset_input_buffer()
+    s.write(frame)
+    s.flush()
+    return _read_reply(s, read_bytes).hex()
+
+
 def main(argv: list[str] | None = None) -> int:
     """Program entrypoint."""
     args = parse_args(argv or sys.argv[1:])
 
+    frame = b""
     if args.raw:
         try:
-            frame = binascii.unhexlify(args.raw.replace(" ", ""))
-        except binascii.Error, ValueError:
+            frame = bytes.fromhex(args.raw.replace(" ", ""))
+        except ValueError:
             sys.stderr.write("Invalid --raw hex string\n")
             return 2
-    else:
+    elif not args.batch:
         if args.code is None:
             sys.stderr.write("--code is required when using --id\n")
             return 2
@@ -85,11 +126,22 @@ def main(argv: list[str] | None = None) -> int:
         xonxoff=False,
         rtscts=False,
     ) as s:
-        s.reset_input_buffer()
-        s.write(frame)
-        s.flush()
-        data = s.read(args.read_bytes)
-        sys.stdout.write(binascii.hexlify(data).decode() + "\n")
+        if args.batch:
+            # One port open for the whole run: skips the per-command TTY
+            # open/close and baud setup when bulk-testing frames
+            for line in sys.stdin:
+                text = line.strip().replace(" ", "")
+                if not text:
+                    continue
+                try:
+                    frame = bytes.fromhex(text)
+                except ValueError:
+                    sys.stderr.write(f"Skipping invalid hex line: {text}\n")
+                    continue
+                sys.stdout.write(_send_frame(s, frame, args.read_bytes) + "\n")
+                sys.stdout.flush()
+        else:
+            sys.stdout.write(_send_frame(s, frame, args.read_bytes) + "\n")
     return 0
 
 
@@ -7,8 +7,8 @@ Usage: scripts/serial_test.py /dev/pts/N
 
 from __future__ import annotations
 
-import binascii
 import sys
+import time
 
 import serial
 
@@ -34,10 +34,21 @@ def main() -> int:
         rtscts=False,
     ) as s:
         s.reset_input_buffer()
-        s.write(binascii.unhexlify("540001000156"))
+        s.write(bytes.fromhex("540001000156"))
         s.flush()
-        data = binascii.hexlify(s.read(16)).decode()
-        sys.stdout.write(f"{data}\n")
+        # Return as soon as the reply stops growing instead of letting
+        # read(16) wait out the full 1s timeout for a 3-byte ACK
+        deadline = time.monotonic() + 1.0
+        buf = bytearray()
+        while time.monotonic() < deadline and len(buf) < 16:  # noqa: PLR2004
+            n = s.in_waiting
+            if n:
+                buf += s.read(n)
+            elif buf:
+                break
+            else:
+                time.sleep(0.001)
+        sys.stdout.write(f"{bytes(buf).hex()}\n")
     return 0
 
 
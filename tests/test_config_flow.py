@@ -1,23 +1,33 @@
 """Tests for the user-facing config flow.
 
-Focused on the initial `async_step_user` and `async_step_manual_port`
-paths. The deep learning-wizard options flow is exercised end-to-end
+Focused on the initial `async_step_user` / `async_step_manual_port`
+paths plus the advanced-settings options step and the learn pacing it
+tunes. The deep learning-wizard options flow is exercised end-to-end
 against real hardware and isn't unit-tested here.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
 from homeassistant import config_entries, data_entry_flow
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.bromic_smart_heat_link.config_flow import OptionsFlowHandler
 from custom_components.bromic_smart_heat_link.const import (
+    CONF_CONTROLLERS,
+    CONF_LEARN_FAST_MODE,
+    CONF_LEARN_RETRY_ATTEMPTS,
+    CONF_LEARN_RETRY_DELAY,
     CONF_SERIAL_PORT,
+    DEFAULT_LEARN_RETRY_ATTEMPTS,
+    DEFAULT_LEARN_RETRY_DELAY,
     DOMAIN,
 )
 
 if TYPE_CHECKING:
+    import pytest
     from homeassistant.core import HomeAssistant
 
 
@@ -54,6 +64,10 @@ class TestUserStep:
                 "custom_components.bromic_smart_heat_link.config_flow.BromicHub.discover_ports",
                 AsyncMock(return_value=discovered),
             ),
+            patch(
+                "custom_components.bromic_smart_heat_link.config_flow.BromicHub.async_validate_port",
+                AsyncMock(return_value=True),
+            ),
             patch(
                 "custom_components.bromic_smart_heat_link.config_flow.BromicHub.async_connect",
                 AsyncMock(),
@@ -88,6 +102,10 @@ class TestUserStep:
                 "custom_components.bromic_smart_heat_link.config_flow.BromicHub.discover_ports",
                 AsyncMock(return_value=discovered),
             ),
+            patch(
+                "custom_components.bromic_smart_heat_link.config_flow.BromicHub.async_validate_port",
+                AsyncMock(return_value=True),
+            ),
             patch(
                 "custom_components.bromic_smart_heat_link.config_flow.BromicHub.async_connect",
                 AsyncMock(side_effect=RuntimeError("nope")),
@@ -121,6 +139,10 @@ class TestManualPortStep:
                 "custom_components.bromic_smart_heat_link.config_flow.BromicHub.discover_ports",
                 AsyncMock(return_value=[]),
             ),
+            patch(
+                "custom_components.bromic_smart_heat_link.config_flow.BromicHub.async_validate_port",
+                AsyncMock(return_value=True),
+            ),
             patch(
                 "custom_components.bromic_smart_heat_link.config_flow.BromicHub.async_connect",
                 AsyncMock(),
@@ -146,3 +168,140 @@ class TestManualPortStep:
 
         assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
         assert result["data"][CONF_SERIAL_PORT] == "/dev/ttyACM0"
+
+
+def _make_options_handler(
+    hass: HomeAssistant, options: dict[str, Any]
+) -> OptionsFlowHandler:
+    """Build an options-flow handler against an entry with the given options."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_SERIAL_PORT: "/dev/ttyUSB0"},
+        options=options,
+    )
+    entry.add_to_hass(hass)
+    handler = OptionsFlowHandler(entry)
+    handler.hass = hass
+    return handler
+
+
+class TestAdvancedSettingsOptions:
+    """The advanced-settings step and the learn pacing it makes tunable."""
+
+    async def test_step_renders_and_saves(self, hass: HomeAssistant) -> None:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={CONF_SERIAL_PORT: "/dev/ttyUSB0"},
+            options={CONF_CONTROLLERS: {}},
+        )
+        entry.add_to_hass(hass)
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        assert result["type"] == data_entry_flow.FlowResultType.MENU
+
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {"next_step_id": "advanced_settings"}
+        )
+        assert result["type"] == data_entry_flow.FlowResultType.FORM
+        assert result["step_id"] == "advanced_settings"
+
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_LEARN_RETRY_ATTEMPTS: 5,
+                CONF_LEARN_RETRY_DELAY: 0.5,
+                CONF_LEARN_FAST_MODE: False,
+            },
+        )
+        assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+        assert result["data"][CONF_LEARN_RETRY_ATTEMPTS] == 5
+        assert result["data"][CONF_LEARN_RETRY_DELAY] == 0.5
+        # The merge preserves unrelated existing options.
+        assert result["data"][CONF_CONTROLLERS] == {}
+
+    async def test_learn_pacing_comes_from_options(
+        self, hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        handler = _make_options_handler(
+            hass, {CONF_LEARN_RETRY_ATTEMPTS: 2, CONF_LEARN_RETRY_DELAY: 0.05}
+        )
+        handler._learn_button = AsyncMock()
+
+        delays: list[float] = []
+
+        async def _fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(
+            "custom_components.bromic_smart_heat_link.config_flow.asyncio.sleep",
+            _fake_sleep,
+        )
+
+        await handler._send_learn_with_retries(1, 1)
+        assert handler._learn_button.await_count == 2
+        # One inter-send pause, at the configured spacing.
+        assert delays == [0.05]
+
+    async def test_learn_pacing_defaults_without_options(
+        self, hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        handler = _make_options_handler(hass, {})
+        handler._learn_button = AsyncMock()
+
+        delays: list[float] = []
+
+        async def _fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(
+            "custom_components.bromic_smart_heat_link.config_flow.asyncio.sleep",
+            _fake_sleep,
+        )
+
+        await handler._send_learn_with_retries(1, 1)
+        assert handler._learn_button.await_count == DEFAULT_LEARN_RETRY_ATTEMPTS
+        assert delays == [DEFAULT_LEARN_RETRY_DELAY] * (
+            DEFAULT_LEARN_RETRY_ATTEMPTS - 1
+        )
+
+    async def test_fast_mode_stops_after_first_ack(
+        self, hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Opt-in fast mode trusts the first acknowledged send: no resends,
+        # no inter-send sleeps, even with a higher attempt count configured.
+        handler = _make_options_handler(
+            hass, {CONF_LEARN_FAST_MODE: True, CONF_LEARN_RETRY_ATTEMPTS: 3}
+        )
+        handler._learn_button = AsyncMock()
+
+        delays: list[float] = []
+
+        async def _fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(
+            "custom_components.bromic_smart_heat_link.config_flow.asyncio.sleep",
+            _fake_sleep,
+        )
+
+        await handler._send_learn_with_retries(1, 1)
+        assert handler._learn_button.await_count == 1
+        assert delays == []
+
+    async def test_fast_mode_off_keeps_resending(
+        self, hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Explicitly disabled (and by default): the full resend loop runs.
+        handler = _make_options_handler(hass, {CONF_LEARN_FAST_MODE: False})
+        handler._learn_button = AsyncMock()
+
+        async def _fake_sleep(_delay: float) -> None:
+            return None
+
+        monkeypatch.setattr(
+            "custom_components.bromic_smart_heat_link.config_flow.asyncio.sleep",
+            _fake_sleep,
+        )
+
+        await handler._send_learn_with_retries(1, 1)
+        assert handler._learn_button.await_count == DEFAULT_LEARN_RETRY_ATTEMPTS
@@ -44,7 +44,8 @@ async def test_serial_port_redacted_in_data(hass: HomeAssistant) -> None:
     hub.connected = True
     hub.port = "/dev/ttyUSB0"
     hub.stats = {"commands_sent": 5}
-    hass.data[DOMAIN] = {entry.entry_id: {"hub": hub}}
+    entry.runtime_data = hub
+    hass.data[DOMAIN] = {entry.entry_id: hub}
 
     diag = await async_get_config_entry_diagnostics(hass, entry)
     # Redacted form is **REDACTED** (HA's standard sentinel).
@@ -64,7 +65,8 @@ async def test_hub_port_redacted_in_hub_section(hass: HomeAssistant) -> None:
     hub.connected = True
     hub.port = "/dev/ttyUSB0"
     hub.stats = {"commands_sent": 0}
-    hass.data[DOMAIN] = {entry.entry_id: {"hub": hub}}
+    entry.runtime_data = hub
+    hass.data[DOMAIN] = {entry.entry_id: hub}
 
     diag = await async_get_config_entry_diagnostics(hass, entry)
     assert diag["hub"]["port"] != "/dev/ttyUSB0"
@@ -87,7 +89,8 @@ async def test_hub_stats_surface(hass: HomeAssistant) -> None:
         "commands_successful": 5,
         "commands_failed": 2,
     }
-    hass.data[DOMAIN] = {entry.entry_id: {"hub": hub}}
+    entry.runtime_data = hub
+    hass.data[DOMAIN] = {entry.entry_id: hub}
 
     diag = await async_get_config_entry_diagnostics(hass, entry)
     assert diag["hub"]["connected"] is True
@@ -127,7 +130,8 @@ async def test_controllers_summary(hass: HomeAssistant) -> None:
     hub.connected = True
     hub.port = "/dev/ttyUSB0"
     hub.stats = {}
-    hass.data[DOMAIN] = {entry.entry_id: {"hub": hub}}
+    entry.runtime_data = hub
+    hass.data[DOMAIN] = {entry.entry_id: hub}
 
     diag = await async_get_config_entry_diagnostics(hass, entry)
 
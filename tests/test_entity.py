@@ -26,7 +26,9 @@ def _make_hub(
     """Mock just enough of `BromicHub` for `BromicEntity` to use."""
     hub = MagicMock(name="hub")
     hub.port = port
+    hub.port_id = port.replace("/", "_").replace(":", "_")
     hub.stats = {"last_success": last_success}
+    hub.last_success_ts = last_success
     hub.async_send_command = AsyncMock()
     return hub
 
@@ -8,6 +8,7 @@ retry policy, statistics tracking, the `ConfigEntryNotReady` path used by
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -20,6 +21,7 @@ from custom_components.bromic_smart_heat_link.exceptions import (
     BromicTimeoutError,
 )
 from custom_components.bromic_smart_heat_link.hub import BromicHub
+from custom_components.bromic_smart_heat_link.protocol import BromicProtocol
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -70,11 +72,13 @@ class TestInitialization:
         assert hub.port == "/dev/ttyUSB0"
         assert hub.connected is False
 
-    def test_stats_returns_copy(self, hass: HomeAssistant) -> None:
-        # The `stats` property must return a copy — callers shouldn't mutate live state.
+    def test_stats_returns_read_only_view(self, hass: HomeAssistant) -> None:
+        # The `stats` property returns a read-only view — callers can't mutate
+        # live state, and no copy is allocated per access.
         hub = BromicHub(hass, "/dev/ttyUSB0")
         snap = hub.stats
-        snap["commands_sent"] = 999
+        with pytest.raises(TypeError):
+            snap["commands_sent"] = 999  # type: ignore[index]
         assert hub.stats["commands_sent"] == 0
 
     def test_stats_initial_zero(self, hass: HomeAssistant) -> None:
@@ -314,6 +318,88 @@ class TestAsyncSendCommand:
         assert hub.stats["commands_successful"] == 1
 
 
+def _make_chunked_serial(chunks: list[bytes]) -> MagicMock:
+    """Build a fake serial whose successive `read()` calls return `chunks`.
+
+    Once the list is exhausted, further reads return b"" (pyserial's timeout
+    shape). `_read_exactly` also assigns `timeout` per read; MagicMock absorbs
+    that.
+    """
+    fake = MagicMock(name="fake_serial.Serial")
+    fake.is_open = True
+    remaining = list(chunks)
+    fake.read.side_effect = lambda _n=1: remaining.pop(0) if remaining else b""
+    return fake
+
+
+class TestReadFraming:
+    """`_read_exactly` / `_read_response`: deadlines, dribble, and `_dirty_rx`."""
+
+    def test_read_exactly_collects_frame_across_reads(
+        self, hass: HomeAssistant
+    ) -> None:
+        # A 3-byte ACK dribbling in one byte per read() is still assembled.
+        hub = BromicHub(hass, "/dev/ttyUSB0")
+        hub._serial = _make_chunked_serial([b"\x54", b"\x06", b"\x5a"])
+        assert hub._read_exactly(3, time.monotonic() + 1.0) == ACK_RESPONSE
+
+    def test_read_exactly_gives_up_at_deadline(self, hass: HomeAssistant) -> None:
+        # An already-expired deadline returns without touching the port.
+        hub = BromicHub(hass, "/dev/ttyUSB0")
+        hub._serial = _make_chunked_serial([b"\x54"])
+        assert hub._read_exactly(3, time.monotonic() - 1.0) == b""
+        hub._serial.read.assert_not_called()
+
+    def test_read_exactly_stops_on_empty_read(self, hass: HomeAssistant) -> None:
+        # An empty read (pyserial timeout) ends the loop with a short result.
+        hub = BromicHub(hass, "/dev/ttyUSB0")
+        hub._serial = _make_chunked_serial([b"\x54", b""])
+        assert hub._read_exactly(3, time.monotonic() + 30.0) == b"\x54"
+
+    def test_read_response_full_frame_keeps_rx_clean(self, hass: HomeAssistant) -> None:
+        hub = BromicHub(hass, "/dev/ttyUSB0")
+        hub._serial = _make_chunked_serial([ACK_RESPONSE])
+        assert hub._read_response() == ACK_RESPONSE
+        assert hub._dirty_rx is False
+
+    def test_read_response_partial_frame_sets_dirty(self, hass: HomeAssistant) -> None:
+        # A short read is still handed to the decoder, but the line state is
+        # suspect: the next send must flush whatever arrives late.
+        hub = BromicHub(hass, "/dev/ttyUSB0")
+        hub._serial = _make_chunked_serial([b"\x54"])
+        assert hub._read_response() == b"\x54"
+        assert hub._dirty_rx is True
+
+    def test_read_response_no_data_raises_and_sets_dirty(
+        self, hass: HomeAssistant
+    ) -> None:
+        hub = BromicHub(hass, "/dev/ttyUSB0")
+        hub._serial = _make_chunked_serial([])
+        with pytest.raises(BromicTimeoutError):
+            hub._read_response()
+        assert hub._dirty_rx is True
+
+    def test_dirty_rx_flushes_before_next_send(self, hass: HomeAssistant) -> None:
+        # After an abnormal transaction, the next send drops stale input via
+        # one reset_input_buffer() and clears the flag.
+        hub = BromicHub(hass, "/dev/ttyUSB0")
+        hub._serial = _make_chunked_serial([ACK_RESPONSE])
+        hub._dirty_rx = True
+        response = hub._send_command_sync(BromicProtocol.encode_command(1, 1))
+        assert response.success is True
+        hub._serial.reset_input_buffer.assert_called_once()
+        assert hub._dirty_rx is False
+
+    def test_clean_rx_skips_flush(self, hass: HomeAssistant) -> None:
+        # A clean previous exchange leaves nothing behind; the per-command
+        # flush (and its ioctl) is skipped entirely.
+        hub = BromicHub(hass, "/dev/ttyUSB0")
+        hub._serial = _make_chunked_serial([ACK_RESPONSE])
+        response = hub._send_command_sync(BromicProtocol.encode_command(1, 1))
+        assert response.success is True
+        hub._serial.reset_input_buffer.assert_not_called()
+
+
 class TestAsyncTestConnection:
     """`async_test_connection` returns True iff a no-op command succeeds."""
 
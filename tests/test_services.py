@@ -48,7 +48,7 @@ def _install_connected_hub(
     hub.connected = True
     hub.async_send_command = AsyncMock(return_value=send_result)
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN]["test_entry"] = {"hub": hub}
+    hass.data[DOMAIN]["test_entry"] = hub
     return hub
 
 
@@ -62,7 +62,7 @@ class TestGetHub:
     def test_returns_none_when_no_hub_connected(self, hass: HomeAssistant) -> None:
         hub = MagicMock()
         hub.connected = False
-        hass.data[DOMAIN] = {"entry": {"hub": hub}}
+        hass.data[DOMAIN] = {"entry": hub}
         assert _get_hub(hass) is None
 
     def test_returns_first_connected_hub(self, hass: HomeAssistant) -> None:
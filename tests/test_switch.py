@@ -21,7 +21,9 @@ def _make_switch(
 ) -> tuple[BromicSwitch, MagicMock]:
     hub = MagicMock(name="hub")
     hub.port = "/dev/ttyUSB0"
+    hub.port_id = "_dev_ttyUSB0"
     hub.stats = {"last_success": 0.0}
+    hub.last_success_ts = 0.0
     if send_result is None:
         send_result = BromicResponse(
             success=True, error_code=None, message="ok", raw_bytes=b""